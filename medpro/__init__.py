@@ -9,10 +9,17 @@ del get_versions
 import medcoupling as mc
 import os
 
+from .cache import *
 from .mesh import *
 from .param import *
+from .expression import *
+from .tensor import *
+from .stats import *
 from .field import *
-from typing import List, Dict
+from .sidecar import *
+from .combination import *
+from .deferred import *
+from typing import Callable, List, Dict
 import traceback
 
 
@@ -21,21 +28,185 @@ class MEDFilePost:
     https://docs.salome-platform.org/latest/dev/MEDCoupling/developer/classMEDCoupling_1_1MEDFileData.html
     """
 
-    def __init__(self, file_name: str | pathlib.Path | None = None):
+    def __init__(
+        self,
+        file_name: str | pathlib.Path | None = None,
+        lazy: bool = False,
+        fields: List[str] | None = None,
+        meshes: List[str] | None = None,
+        timesteps: slice | Callable[[TimeStamp], bool] | None = None,
+        timestep_cache: TimestepCache | None = None,
+    ):
+        """In lazy mode only the headers (mesh names, field names, components, timesteps and
+        profiles) are read, mesh and field arrays are loaded on first access.
+
+        fields, meshes and timesteps restrict what is read from the file: timesteps is either
+        a slice over the timesteps of each field or a predicate on their TimeStamp. When only
+        fields are given, only the meshes they lie on are read.
+
+        timestep_cache bounds the memory used by the timestep arrays read by the field evols,
+        it can be shared between several MEDFilePost. With a timestep_cache the fields are
+        always opened with their headers only, as in lazy mode, all their arrays are then read
+        through the cache. Meshes are still read at once unless lazy."""
         if isinstance(file_name, pathlib.Path):
             file_name = file_name.as_posix()
+        self.file_name = file_name
+        self.timestep_cache = timestep_cache
 
         file_data: mc.MEDFileData
-        if file_name is not None:
+        self.__lazy_meshes: Dict[str, MEDMesh] = {}
+        selective = fields is not None or meshes is not None or timesteps is not None
+        if file_name is not None and selective:
+            file_data = mc.MEDFileData.New()
+            field_names = self.__select_field_names(file_name, fields, meshes)
+            mesh_names = self.__select_mesh_names(file_name, field_names, fields, meshes)
+            file_data.setFields(
+                self.__load_fields(
+                    file_name,
+                    field_names,
+                    timesteps,
+                    load_arrays=not lazy and timestep_cache is None,
+                )
+            )
+            file_data.setParams(mc.MEDFileParameters.New(file_name))
+            if lazy:
+                self.__lazy_meshes = {
+                    mesh_name: MEDMesh.from_file(file_name, mesh_name)
+                    for mesh_name in mesh_names
+                }
+            else:
+                file_meshes = mc.MEDFileMeshes.New()
+                for mesh_name in mesh_names:
+                    file_meshes.pushMesh(mc.MEDFileMesh.New(file_name, mesh_name))
+                file_data.setMeshes(file_meshes)
+        elif file_name is not None and lazy:
+            file_data = mc.MEDFileData.New()
+            file_data.setFields(mc.MEDFileFields.New(file_name, False))
+            file_data.setParams(mc.MEDFileParameters.New(file_name))
+            self.__lazy_meshes = {
+                mesh_name: MEDMesh.from_file(file_name, mesh_name)
+                for mesh_name in mc.GetMeshNames(file_name)
+            }
+        elif file_name is not None and timestep_cache is not None:
+            file_data = mc.MEDFileData.New()
+            file_data.setFields(mc.MEDFileFields.New(file_name, False))
+            file_data.setParams(mc.MEDFileParameters.New(file_name))
+            file_meshes = mc.MEDFileMeshes.New()
+            for mesh_name in mc.GetMeshNames(file_name):
+                file_meshes.pushMesh(mc.MEDFileMesh.New(file_name, mesh_name))
+            file_data.setMeshes(file_meshes)
+        elif file_name is not None:
             file_data = mc.MEDFileData.New(file_name)
         else:
             file_data = mc.MEDFileData.New()
         self.file_data = file_data
+        self.__meshes_by_name: Dict[str, MEDMesh] | None = None
+        self.__fieldevols_by_name: Dict[str, MEDFieldEvol] | None = None
+
+    @staticmethod
+    def __select_field_names(
+        file_name: str, fields: List[str] | None, meshes: List[str] | None
+    ) -> List[str]:
+        all_field_names = mc.GetAllFieldNames(file_name)
+        if fields is None:
+            field_names = list(all_field_names)
+        else:
+            missing = [field_name for field_name in fields if field_name not in all_field_names]
+            if missing:
+                raise ValueError(f"Fields {missing=} not found in {file_name=}")
+            field_names = list(fields)
+        if meshes is not None:
+            field_names = [
+                field_name
+                for field_name in field_names
+                if mc.GetMeshNamesOnField(file_name, field_name)[0] in meshes
+            ]
+        return field_names
+
+    @staticmethod
+    def __select_mesh_names(
+        file_name: str,
+        field_names: List[str],
+        fields: List[str] | None,
+        meshes: List[str] | None,
+    ) -> List[str]:
+        all_mesh_names = mc.GetMeshNames(file_name)
+        if meshes is not None:
+            missing = [mesh_name for mesh_name in meshes if mesh_name not in all_mesh_names]
+            if missing:
+                raise ValueError(f"Meshes {missing=} not found in {file_name=}")
+            return list(meshes)
+        if fields is not None:
+            used_mesh_names = {
+                mesh_name
+                for field_name in field_names
+                for mesh_name in mc.GetMeshNamesOnField(file_name, field_name)
+            }
+            return [mesh_name for mesh_name in all_mesh_names if mesh_name in used_mesh_names]
+        return list(all_mesh_names)
+
+    @staticmethod
+    def __load_fields(
+        file_name: str,
+        field_names: List[str],
+        timesteps: slice | Callable[[TimeStamp], bool] | None,
+        load_arrays: bool,
+    ) -> mc.MEDFileFields:
+        # Only headers are read here, the fields keep the file name to read the kept arrays later
+        file_fields: mc.MEDFileFields = mc.MEDFileFields.New(file_name, False)
+        for pos in reversed(range(file_fields.getNumberOfFields())):
+            if file_fields[pos].getName() not in field_names:
+                file_fields.destroyFieldAtPos(pos)
+        for pos in reversed(range(file_fields.getNumberOfFields())):
+            file_field_multits: mc.MEDFileFieldMultiTS = file_fields[pos]
+            if timesteps is not None:
+                all_timestamps = [
+                    TimeStamp(iteration, order, time)
+                    for iteration, order, time in file_field_multits.getTimeSteps()
+                ]
+                if isinstance(timesteps, slice):
+                    kept_ids = set(range(len(all_timestamps))[timesteps])
+                else:
+                    kept_ids = {
+                        timestep_id
+                        for timestep_id, timestamp in enumerate(all_timestamps)
+                        if timesteps(timestamp)
+                    }
+                erased_ids = [
+                    timestep_id
+                    for timestep_id in range(len(all_timestamps))
+                    if timestep_id not in kept_ids
+                ]
+                if len(erased_ids) == len(all_timestamps):
+                    file_fields.destroyFieldAtPos(pos)
+                    continue
+                if erased_ids:
+                    file_field_multits.eraseTimeStepIds(erased_ids)
+            if load_arrays:
+                file_field_multits.loadArrays()
+        return file_fields
+
+    def invalidate(self) -> None:
+        """Forget the cached mesh and field evol wrappers, to be called after modifying file_data directly"""
+        self.__meshes_by_name = None
+        self.__fieldevols_by_name = None
+
+    def __load_lazy_meshes(self) -> None:
+        # Meshes of a lazy file are pushed in file_data only when it is needed (check, write)
+        for mesh in self.__lazy_meshes.values():
+            self.add_mesh(mesh)
+        self.__lazy_meshes = {}
 
     @property
     def meshes_by_name(self) -> Dict[str, MEDMesh]:
+        if self.__meshes_by_name is None:
+            self.__meshes_by_name = self.__build_meshes_by_name()
+        return self.__meshes_by_name
+
+    def __build_meshes_by_name(self) -> Dict[str, MEDMesh]:
+        meshes_by_name: Dict[str, MEDMesh]
         try:
-            return (
+            meshes_by_name = (
                 {
                     file_mesh.getName(): MEDMesh(file_mesh)
                     for file_mesh in self.file_data.getMeshes()
@@ -44,7 +215,9 @@ class MEDFilePost:
                 else {}
             )
         except mc.InterpKernelException:
-            return {}
+            meshes_by_name = {}
+        meshes_by_name.update(self.__lazy_meshes)
+        return meshes_by_name
 
     @property
     def params_by_name(self) -> Dict[str, MEDParam]:
@@ -62,12 +235,19 @@ class MEDFilePost:
 
     @property
     def fieldevols_by_name(self) -> Dict[str, MEDFieldEvol]:
+        if self.__fieldevols_by_name is None:
+            self.__fieldevols_by_name = self.__build_fieldevols_by_name()
+        return self.__fieldevols_by_name
+
+    def __build_fieldevols_by_name(self) -> Dict[str, MEDFieldEvol]:
         meshes_by_name = self.meshes_by_name
         try:
             return (
                 {
                     field_file.getName(): MEDFieldEvol(
-                        meshes_by_name[field_file.getMeshName()], field_file
+                        meshes_by_name[field_file.getMeshName()],
+                        field_file,
+                        timestep_cache=self.timestep_cache,
                     )
                     for field_file in self.file_data.getFields()
                 }
@@ -84,7 +264,9 @@ class MEDFilePost:
             meshes = mc.MEDFileMeshes.New()
             self.file_data.setMeshes(meshes)
         assert meshes is not None
-        meshes.pushMesh(mesh.mesh_file)        
+        meshes.pushMesh(mesh.mesh_file)
+        if self.__meshes_by_name is not None:
+            self.__meshes_by_name[mesh.name] = mesh
 
     def add_fieldevol(self, field_evol: MEDFieldEvol) -> None:
         fields: mc.MEDFileFields | None = self.file_data.getFields()
@@ -93,8 +275,108 @@ class MEDFilePost:
             self.file_data.setFields(fields)
         assert fields is not None
         fields.pushField(field_evol.file_field_multits)
+        if self.__fieldevols_by_name is not None:
+            self.__fieldevols_by_name[field_evol.name] = field_evol
+
+    def load_field_on_group(self, field_name: str, group_name: str) -> MEDFieldEvol:
+        """Read from file only the values of a node field on the nodes of a group.
+
+        The cells of each geometric type are read as the smallest slice covering the group
+        (MEDFileUMesh.LoadPartOf), field values only on the nodes of this partial mesh.
+        Fields stored with a profile cannot be partially read by MEDCoupling and fall back
+        to extract_group.
+        """
+        if self.file_name is None:
+            raise ValueError("load_field_on_group needs a MEDFilePost read from a file.")
+        file_name: str = self.file_name
+
+        header_multits = mc.MEDFileFieldMultiTS.New(file_name, field_name, False)
+        mesh = self.meshes_by_name[header_multits.getMeshName()]
+        if header_multits.getPfls():
+            return self.fieldevols_by_name[field_name].extract_group(group_name)
+        if header_multits.getTypesOfFieldAvailable()[0] != [mc.ON_NODES]:
+            raise NotImplementedError(
+                f"Partial read of {field_name=} not on nodes, not yet coded and tested"
+            )
+        group_levels = mesh.mesh_file.getGrpNonEmptyLevelsExt(group_name)
+        if tuple(group_levels) != (0,):
+            raise NotImplementedError(
+                f"Partial read of {group_name=} defined on levels {group_levels=}, not yet coded and tested"
+            )
+        group_cell_ids = mesh.get_group_by_name(group_name).cell_ids
+
+        # Smallest slice of cells covering the group, per geometric type
+        whole_mesh: mc.MEDCouplingUMesh = mesh.mesh_file.getMeshAtLevel(0)
+        distribution = whole_mesh.getDistributionOfTypes()
+        types: List[int] = []
+        slices: List[int] = []
+        local_cell_ids = []
+        type_start = 0
+        local_start = 0
+        for cell_type, num_cells, _ in distribution:
+            type_cell_ids = group_cell_ids[
+                (group_cell_ids >= type_start) & (group_cell_ids < type_start + num_cells)
+            ] - type_start
+            if len(type_cell_ids) > 0:
+                first, last = int(type_cell_ids.min()), int(type_cell_ids.max()) + 1
+                types.append(cell_type)
+                slices.extend([first, last, 1])
+                local_cell_ids.extend((type_cell_ids - first + local_start).tolist())
+                local_start += last - first
+            type_start += num_cells
+
+        part_mesh: mc.MEDFileUMesh = mc.MEDFileUMesh.LoadPartOf(
+            file_name, mesh.name, types, slices
+        )
+        part_meshes: mc.MEDFileMeshes = mc.MEDFileMeshes.New()
+        part_meshes.pushMesh(part_mesh)
+        part_fields: mc.MEDFileFields = mc.MEDFileFields.LoadPartOf(file_name, False, part_meshes)
+        part_multits: mc.MEDFileFieldMultiTS = part_fields[field_name]
+
+        # Reduced mesh on the group cells, its nodes keep the order of the partial mesh
+        group_mesh: mc.MEDCouplingUMesh = part_mesh.getMeshAtLevel(0).buildPartOfMySelf(
+            local_cell_ids, keepCoords=False
+        )
+        group_mesh.setName(mesh.name)
+        local_node_ids_o2n, num_group_nodes = (
+            part_mesh.getMeshAtLevel(0)[local_cell_ids].getNodeIdsInUse()
+        )
+        local_node_ids: mc.DataArrayInt = local_node_ids_o2n.invertArrayO2N2N2O(num_group_nodes)
+        part_node_ids: mc.DataArrayInt = part_mesh.getPartDefAtLevel(1).toDAI()
+        profile_array: mc.DataArrayInt = part_node_ids[local_node_ids]
+        profile_array.setName(f"{field_name}_{group_name}")
+
+        extracted_fieldevol: mc.MEDFileFieldMultiTS = mc.MEDFileFieldMultiTS.New()
+        for field_1ts in part_multits:
+            field_1ts.loadArraysIfNecessary()
+            field_vals, _ = field_1ts.getFieldWithProfile(mc.ON_NODES, 0, part_mesh)
+            double_field: mc.MEDCouplingFieldDouble = mc.MEDCouplingFieldDouble.New(
+                mc.ON_NODES, mc.ONE_TIME
+            )
+            double_field.setName(field_name)
+            double_field.setMesh(group_mesh)
+            double_field.setArray(field_vals[local_node_ids])
+            iteration, order, time = field_1ts.getTime()
+            double_field.setTime(time, iteration, order)
+            extracted_fieldevol.appendFieldProfile(double_field, mesh.mesh_file, 0, profile_array)
+            field_1ts.unloadArrays()
+        return MEDFieldEvol(mesh, extracted_fieldevol, mesh.intern_profile(profile_array))
+
+    def history_sidecar(self, field_name: str, path: str | None = None) -> HistorySidecar:
+        """Node-major sidecar of a node field evolution, built on first call and reopened
+        (memory-mapped) afterwards as long as the MED file and the read timesteps are unchanged"""
+        if self.file_name is None:
+            raise ValueError("history_sidecar needs a MEDFilePost read from a file.")
+        if path is None:
+            path = f"{self.file_name}.{field_name}.history.npy"
+        fieldevol = self.fieldevols_by_name[field_name]
+        sidecar = HistorySidecar.open(path, self.file_name, fieldevol)
+        if sidecar is None:
+            sidecar = HistorySidecar.build(fieldevol, path, self.file_name)
+        return sidecar
 
     def check(self) -> None:
+        self.__load_lazy_meshes()
         meshes_by_name = self.meshes_by_name
         for mesh in meshes_by_name.values():
             mesh.check()
@@ -104,6 +386,10 @@ class MEDFilePost:
 
     def write(self, output_file_name: str) -> None:
         self.check()
+        fields: mc.MEDFileFields | None = self.file_data.getFields()
+        if fields is not None:
+            # Arrays may have been unloaded (lazy mode, iter_fields or the timestep cache)
+            fields.loadArraysIfNecessary()
         if sys.platform == "win32":
             # write33 raises mc.InterpKernelException on windows
             self.file_data.write(output_file_name, 2)
@@ -0,0 +1,75 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+import threading
+from typing import Any, Hashable, Tuple
+
+import medcoupling as mc
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    loaded_bytes: int = 0
+
+
+class TimestepCache:
+    """Least recently used budget for the arrays of the timesteps loaded from file.
+
+    A single instance can be shared by several MEDFilePost to get a global budget.
+    Evicted timesteps are unloaded (unloadArraysWithoutDataLoss) and transparently read
+    again on next access, timesteps which cannot be read again from file are never evicted.
+    Each entry keeps its owner alive, so that an identity used in its key (such as a C++
+    pointer) cannot be reused by another object while the entry exists.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self.__entries: OrderedDict[Hashable, Tuple[mc.MEDFileField1TS, int, Any]] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def load(self, key: Hashable, field_1ts: mc.MEDFileField1TS, owner: Any = None) -> None:
+        """Make sure the arrays of field_1ts are loaded, evicting older timesteps if needed.
+
+        Python wrappers of the same timestep are distinct objects sharing their arrays,
+        key identifies the timestep itself and owner is the object this identity refers to.
+        """
+        with self.__lock:
+            if key in self.__entries:
+                self.stats.hits += 1
+                self.__entries.move_to_end(key)
+                field_1ts.loadArraysIfNecessary()
+                return
+            self.stats.misses += 1
+            field_1ts.loadArraysIfNecessary()
+            size: int = field_1ts.getHeapMemorySize()
+            self.__entries[key] = (field_1ts, size, owner)
+            self.stats.loaded_bytes += size
+            self.__evict()
+
+    def discard(self, key: Hashable) -> None:
+        """Forget a timestep, to be called when its arrays are unloaded elsewhere"""
+        with self.__lock:
+            entry = self.__entries.pop(key, None)
+            if entry is not None:
+                self.stats.loaded_bytes -= entry[1]
+
+    def clear(self) -> None:
+        with self.__lock:
+            while self.__entries:
+                self.__unload_oldest()
+
+    def __evict(self) -> None:
+        # The most recently loaded timestep is always kept, even if above the budget
+        while self.stats.loaded_bytes > self.max_bytes and len(self.__entries) > 1:
+            self.__unload_oldest()
+
+    def __unload_oldest(self) -> None:
+        _, (field_1ts, size, _) = self.__entries.popitem(last=False)
+        self.stats.loaded_bytes -= size
+        loaded_size: int = field_1ts.getHeapMemorySize()
+        field_1ts.unloadArraysWithoutDataLoss()
+        if field_1ts.getHeapMemorySize() < loaded_size:
+            self.stats.evictions += 1
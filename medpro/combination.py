@@ -0,0 +1,125 @@
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+import numpy
+import numpy.typing
+
+from .field import MEDField, MEDFieldEvol
+
+
+def _load_cases(
+    cases: Sequence[MEDField] | MEDFieldEvol,
+) -> Tuple[MEDField, List[numpy.typing.NDArray]]:
+    # Template field of the results and (n_entities, n_components) values of each case
+    if isinstance(cases, MEDFieldEvol):
+        if not cases.timesteps:
+            raise ValueError(f"No timestep in field_evol {cases.name}")
+        first = cases.timesteps[0]
+        return cases.get_field_at_timestep(first.iteration, first.order), list(
+            cases.to_numpy_stack()
+        )
+    cases = list(cases)
+    if not cases:
+        raise ValueError("Cannot combine without load cases")
+    template = cases[0]
+    for case in cases[1:]:
+        if not template.same_support(case) or len(case.components) != len(template.components):
+            raise ValueError(
+                f"Cannot combine {case.name} and {template.name}, different supports."
+            )
+    return template, [numpy.asarray(case) for case in cases]
+
+
+def _combined_chunks(
+    coefficients: numpy.typing.NDArray, values: List[numpy.typing.NDArray], chunk_size: int
+) -> Iterator[Tuple[int, int, numpy.typing.NDArray]]:
+    # (start, stop, (n_combinations, stop - start, n_components)) with one matrix product per chunk
+    num_entities, num_components = values[0].shape
+    for start in range(0, num_entities, chunk_size):
+        stop = min(start + chunk_size, num_entities)
+        chunk = numpy.stack([case[start:stop] for case in values])
+        product = coefficients @ chunk.reshape(len(values), -1)
+        yield start, stop, product.reshape(len(coefficients), stop - start, num_components)
+
+
+def _check_coefficients(
+    coefficients: numpy.typing.ArrayLike, num_cases: int
+) -> numpy.typing.NDArray:
+    coefficients = numpy.atleast_2d(numpy.asarray(coefficients, dtype=numpy.float64))
+    if coefficients.ndim != 2 or coefficients.shape[1] != num_cases:
+        raise ValueError(
+            f"Expected coefficients of shape (n_combinations, {num_cases}), got {coefficients.shape}"
+        )
+    return coefficients
+
+
+def combine_load_cases(
+    coefficients: numpy.typing.ArrayLike,
+    cases: Sequence[MEDField] | MEDFieldEvol,
+    name: str | None = None,
+    chunk_size: int = 4096,
+) -> MEDFieldEvol:
+    """Linear combinations sum_i coefficients[k, i] * cases[i] of load cases.
+
+    cases are fields on the same support or the timesteps of a field evolution. All the
+    combinations are computed together as one matrix product per chunk of chunk_size
+    entities, combination k is the timestep of iteration and order k + 1 of the result.
+    """
+    template, values = _load_cases(cases)
+    coefficients = _check_coefficients(coefficients, len(values))
+    num_entities, num_components = values[0].shape
+    results = [numpy.empty((num_entities, num_components)) for _ in coefficients]
+    for start, stop, product in _combined_chunks(coefficients, values, chunk_size):
+        for result, combination in zip(results, product):
+            result[start:stop] = combination
+
+    name = f"{template.name}_comb" if name is None else name
+    med_fields: List[MEDField] = []
+    for pos, result in enumerate(results):
+        med_field = template.with_values(result, name, copy=False)
+        med_field.set_timestamp(pos + 1, pos + 1, float(pos + 1))
+        med_fields.append(med_field)
+    return MEDFieldEvol.from_fields(template.mesh, med_fields)
+
+
+def load_case_envelopes(
+    coefficients: numpy.typing.ArrayLike,
+    cases: Sequence[MEDField] | MEDFieldEvol,
+    kinds: Sequence[str] = ("min", "max"),
+    name: str | None = None,
+    chunk_size: int = 4096,
+) -> Dict[str, Tuple[MEDField, MEDField]]:
+    """Envelopes of the combine_load_cases combinations, reduced chunk by chunk.
+
+    The combinations are never stored for all the entities. For each kind ("min", "max" or
+    "absmax") returns the envelope field and a field holding the number (k + 1) of the
+    combination reaching it, as MEDFieldEvol.envelope does.
+    """
+    unknown = [kind for kind in kinds if kind not in ("min", "max", "absmax")]
+    if unknown:
+        raise ValueError(f"Unknown envelopes {unknown=}, expected 'min', 'max' or 'absmax'")
+    template, values = _load_cases(cases)
+    coefficients = _check_coefficients(coefficients, len(values))
+    envelopes = {kind: numpy.empty(values[0].shape) for kind in kinds}
+    arg_combinations = {kind: numpy.empty(values[0].shape) for kind in kinds}
+    for start, stop, product in _combined_chunks(coefficients, values, chunk_size):
+        for kind in kinds:
+            if kind == "min":
+                arg = product.argmin(axis=0)
+            elif kind == "max":
+                arg = product.argmax(axis=0)
+            else:
+                arg = numpy.abs(product).argmax(axis=0)
+            envelopes[kind][start:stop] = numpy.take_along_axis(product, arg[None], axis=0)[0]
+            arg_combinations[kind][start:stop] = arg + 1
+
+    name = f"{template.name}_comb" if name is None else name
+    results: Dict[str, Tuple[MEDField, MEDField]] = {}
+    for kind in kinds:
+        envelope = template.with_values(envelopes[kind], f"{name}_{kind}", copy=False)
+        arg_combination = template.with_values(
+            arg_combinations[kind], f"{name}_{kind}_comb", copy=False
+        )
+        for med_field in (envelope, arg_combination):
+            med_field.set_timestamp(-1, -1, 0.0)
+        results[kind] = (envelope, arg_combination)
+    return results
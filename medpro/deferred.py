@@ -0,0 +1,115 @@
+from typing import Any, Callable, List
+
+import numpy
+import numpy.typing
+
+from .field import MEDField
+
+
+class DeferredField:
+    """Deferred MEDField arithmetic, built with MEDField.deferred().
+
+    Operators build an expression tree, mesh and profile compatibility is checked once when
+    the tree is built. evaluate() computes the whole expression chunk by chunk into a single
+    output buffer, so that no full size temporary is allocated for intermediate results.
+    """
+
+    def __init__(
+        self,
+        leaves: List[MEDField],
+        evaluator: Callable[[int, int], numpy.typing.NDArray],
+        name: str,
+    ):
+        self.leaves = leaves
+        self.name = name
+        self.__evaluator = evaluator
+
+    @classmethod
+    def from_field(cls, med_field: MEDField) -> "DeferredField":
+        num_components = len(med_field.components)
+
+        def evaluator(start: int, stop: int) -> numpy.typing.NDArray:
+            return med_field.to_numpy().reshape(-1, num_components)[start:stop]
+
+        return cls([med_field], evaluator, med_field.name)
+
+    @property
+    def template(self) -> MEDField:
+        return self.leaves[0]
+
+    @property
+    def num_tuples(self) -> int:
+        return self.template.field_double.getNumberOfTuplesExpected()
+
+    def __combine(
+        self,
+        other: Any,
+        operation: Callable[[Any, Any], numpy.typing.NDArray],
+        symbol: str,
+        name_infix: str,
+        reflected: bool = False,
+    ) -> "DeferredField":
+        if isinstance(other, MEDField):
+            other = DeferredField.from_field(other)
+        if isinstance(other, DeferredField):
+            if not self.template.same_support(other.template):
+                raise ValueError(f"Cannot {symbol} two fields on different supports.")
+            if len(self.template.components) != len(other.template.components):
+                raise ValueError(f"Cannot {symbol} two fields of different shapes.")
+            left, right = (other, self) if reflected else (self, other)
+            left_eval, right_eval = left.__evaluator, right.__evaluator
+            return DeferredField(
+                left.leaves + right.leaves,
+                lambda start, stop: operation(left_eval(start, stop), right_eval(start, stop)),
+                f"{left.name}_{name_infix}_{right.name}",
+            )
+        if isinstance(other, (int, float)):
+            self_eval = self.__evaluator
+            if reflected:
+                return DeferredField(
+                    self.leaves, lambda start, stop: operation(other, self_eval(start, stop)), self.name
+                )
+            return DeferredField(
+                self.leaves, lambda start, stop: operation(self_eval(start, stop), other), self.name
+            )
+        return NotImplemented
+
+    def __neg__(self):
+        self_eval = self.__evaluator
+        return DeferredField(self.leaves, lambda start, stop: -self_eval(start, stop), self.name)
+
+    def __add__(self, other: Any):
+        return self.__combine(other, numpy.add, "add", "plus")
+
+    def __radd__(self, other: Any):
+        return self.__combine(other, numpy.add, "add", "plus", reflected=True)
+
+    def __sub__(self, other: Any):
+        return self.__combine(other, numpy.subtract, "subtract", "minus")
+
+    def __rsub__(self, other: Any):
+        return self.__combine(other, numpy.subtract, "subtract", "minus", reflected=True)
+
+    def __mul__(self, other: Any):
+        return self.__combine(other, numpy.multiply, "multiply", "mul")
+
+    def __rmul__(self, other: Any):
+        return self.__combine(other, numpy.multiply, "multiply", "mul", reflected=True)
+
+    def __truediv__(self, other: Any):
+        return self.__combine(other, numpy.divide, "divide", "div")
+
+    def __rtruediv__(self, other: Any):
+        return self.__combine(other, numpy.divide, "divide", "div", reflected=True)
+
+    def evaluate(self, chunk_size: int = 65536, name: str | None = None) -> MEDField:
+        """Compute the expression into a new MEDField, chunk_size tuples at a time"""
+        num_tuples = self.num_tuples
+        num_components = len(self.template.components)
+        values = numpy.empty((num_tuples, num_components))
+        for start in range(0, num_tuples, chunk_size):
+            stop = min(start + chunk_size, num_tuples)
+            values[start:stop] = self.__evaluator(start, stop)
+        return self.template.with_values(
+            values, self.name if name is None else name, copy=False
+        )
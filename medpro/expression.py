@@ -0,0 +1,156 @@
+import ast
+from dataclasses import dataclass
+import functools
+from typing import Any, Dict, Mapping, Tuple
+
+import numpy
+import numpy.typing
+
+
+EXPRESSION_FUNCTIONS: Dict[str, Any] = {
+    "sqrt": numpy.sqrt,
+    "abs": numpy.abs,
+    "exp": numpy.exp,
+    "log": numpy.log,
+    "ln": numpy.log,
+    "log10": numpy.log10,
+    "sin": numpy.sin,
+    "cos": numpy.cos,
+    "tan": numpy.tan,
+    "asin": numpy.arcsin,
+    "acos": numpy.arccos,
+    "atan": numpy.arctan,
+    "atan2": numpy.arctan2,
+    "sinh": numpy.sinh,
+    "cosh": numpy.cosh,
+    "tanh": numpy.tanh,
+    "sign": numpy.sign,
+    "pow": numpy.power,
+    "max": numpy.maximum,
+    "min": numpy.minimum,
+}
+
+EXPRESSION_CONSTANTS: Dict[str, float] = {"pi": numpy.pi, "e": numpy.e}
+
+# Unit vectors of MEDCoupling expressions, "DX*IVec+DY*JVec" builds a two components result
+UNIT_VECTORS: Tuple[str, ...] = ("IVec", "JVec", "KVec", "LVec", "MVec", "NVec")
+
+_OPERATORS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.USub, ast.UAdd)
+
+
+@dataclass(frozen=True)
+class CompiledExpression:
+    text: str
+    code: Any
+    # (field alias or None for the field the expression is applied to, component name)
+    variables: Tuple[Tuple[str | None, str], ...]
+    num_unit_vectors: int
+
+    def evaluate(
+        self,
+        columns: Mapping[Tuple[str | None, str], numpy.typing.NDArray],
+        num_tuples: int,
+        num_components: int,
+    ) -> numpy.typing.NDArray:
+        """Evaluate on (num_tuples, 1) columns, the result is broadcast to (num_tuples, num_components)"""
+        if self.num_unit_vectors > num_components:
+            raise ValueError(
+                f"{self.text} uses {self.num_unit_vectors} unit vectors, got {num_components=}"
+            )
+        unit_vectors = {
+            name: numpy.eye(num_components)[i] if i < num_components else numpy.zeros(num_components)
+            for i, name in enumerate(UNIT_VECTORS)
+        }
+        namespace = {
+            "__builtins__": {},
+            "_v": columns,
+            "_f": EXPRESSION_FUNCTIONS,
+            "_u": unit_vectors,
+        }
+        result = eval(self.code, namespace)
+        return numpy.broadcast_to(result, (num_tuples, num_components))
+
+
+class _Compiler(ast.NodeTransformer):
+    def __init__(self, text: str):
+        self.text = text
+        self.variables: Dict[Tuple[str | None, str], None] = {}
+        self.num_unit_vectors = 0
+
+    def __variable(self, key: Tuple[str | None, str], node: ast.AST) -> ast.AST:
+        self.variables[key] = None
+        subscript = ast.Subscript(
+            value=ast.Name(id="_v", ctx=ast.Load()),
+            slice=ast.Tuple(elts=[ast.Constant(value=part) for part in key], ctx=ast.Load()),
+            ctx=ast.Load(),
+        )
+        return ast.copy_location(subscript, node)
+
+    def generic_visit(self, node: ast.AST) -> ast.AST:
+        if not isinstance(
+            node,
+            (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant, ast.Load) + _OPERATORS,
+        ):
+            raise ValueError(f"Unsupported {type(node).__name__} in expression {self.text}")
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise ValueError(f"Unsupported constant {node.value!r} in expression {self.text}")
+        return super().generic_visit(node)
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        if node.id in UNIT_VECTORS:
+            self.num_unit_vectors = max(self.num_unit_vectors, UNIT_VECTORS.index(node.id) + 1)
+            lookup = ast.Subscript(
+                value=ast.Name(id="_u", ctx=ast.Load()),
+                slice=ast.Constant(value=node.id),
+                ctx=ast.Load(),
+            )
+            return ast.copy_location(lookup, node)
+        if node.id in EXPRESSION_CONSTANTS:
+            return ast.copy_location(ast.Constant(value=EXPRESSION_CONSTANTS[node.id]), node)
+        return self.__variable((None, node.id), node)
+
+    def visit_Attribute(self, node: ast.Attribute) -> ast.AST:
+        if not isinstance(node.value, ast.Name):
+            raise ValueError(
+                f"Unsupported attribute {ast.unparse(node)} in expression {self.text}"
+            )
+        return self.__variable((node.value.id, node.attr), node)
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        if (
+            not isinstance(node.func, ast.Name)
+            or node.func.id not in EXPRESSION_FUNCTIONS
+            or node.keywords
+        ):
+            raise ValueError(f"Unsupported call {ast.unparse(node)} in expression {self.text}")
+        function = ast.Subscript(
+            value=ast.Name(id="_f", ctx=ast.Load()),
+            slice=ast.Constant(value=node.func.id),
+            ctx=ast.Load(),
+        )
+        call = ast.Call(
+            func=function, args=[self.visit(arg) for arg in node.args], keywords=[]
+        )
+        return ast.copy_location(call, node)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_expression(text: str) -> CompiledExpression:
+    """Parse an expression once into a vectorized kernel, cached by expression text.
+
+    The syntax is the one of MEDCoupling applyFunc expressions (component names as variables,
+    "^" as power, IVec, JVec... as unit vectors), "**" and components of other fields as
+    FIELD.COMPONENT are accepted as well.
+    """
+    try:
+        tree = ast.parse(text.replace("^", "**").strip(), mode="eval")
+    except SyntaxError as error:
+        raise ValueError(f"Invalid expression {text}: {error.msg}") from error
+    compiler = _Compiler(text)
+    tree = ast.fix_missing_locations(compiler.visit(tree))
+    return CompiledExpression(
+        text,
+        compile(tree, f"<expression {text}>", "eval"),
+        tuple(compiler.variables),
+        compiler.num_unit_vectors,
+    )
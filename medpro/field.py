@@ -1,12 +1,19 @@
+import bisect
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 
 import medcoupling as mc
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Deque, Iterable, Iterator, Sequence, Tuple
 from numpy.lib import recfunctions as rfn
 import numpy.typing
 
-from .mesh import MEDMesh, MEDProfile
+from .cache import TimestepCache
+from .expression import compile_expression
+from .mesh import MEDGroupSelection, MEDMesh, MEDProfile
+from .stats import ComponentStats, GroupStats, StatsReduction, segment_reductions
+from .tensor import compute_tensor_invariants, tensor_components
 
 
 @dataclass(frozen=True)
@@ -87,6 +94,198 @@ class MEDField:
         values = self.to_numpy()
         return rfn.unstructured_to_structured(values, names=self.components, copy=False)
 
+    def with_values(
+        self,
+        values: numpy.typing.NDArray,
+        name: str | None = None,
+        components: List[str] | None = None,
+        copy: bool = True,
+    ):
+        """New field on the same mesh, profile, discretization and timestamp with other values
+
+        With copy=False, a float64 C-contiguous array owning its data is handed over to the new
+        field without copy, it must not be used by the caller afterwards.
+        """
+        values = numpy.asarray(values)
+        if values.ndim == 1:
+            values = values.reshape(-1, 1)
+        # DataArrayDouble adopts the buffer of the numpy array it is built from, give it a private copy
+        if not (
+            not copy
+            and values.dtype == numpy.float64
+            and values.flags.c_contiguous
+            and values.flags.owndata
+        ):
+            values = numpy.array(values, dtype=numpy.float64, order="C")
+        if values.shape[0] != self.field_double.getNumberOfTuplesExpected():
+            raise ValueError(
+                f"Expected {self.field_double.getNumberOfTuplesExpected()} tuples, got {values.shape[0]}"
+            )
+        if components is None:
+            components = self.components
+        if len(components) != values.shape[1]:
+            raise ValueError(f"Expected {values.shape[1]} components, got {components=}")
+        array: mc.DataArrayDouble = mc.DataArrayDouble(values)
+        array.setInfoOnComponents(list(components))
+        field_double: mc.MEDCouplingFieldDouble = self.field_double.clone(False)
+        field_double.setArray(array)
+        field_double.setName(self.name if name is None else name)
+        return MEDField(self.mesh, field_double, self.profile)
+
+    def same_support(self, other: "MEDField") -> bool:
+        """Whether other is on the same mesh, profile and discretization, tuple for tuple"""
+        if self.mesh is not other.mesh:
+            return False
+        if self.profile != other.profile:
+            return False
+        return (
+            self.field_double.getTypeOfField() == other.field_double.getTypeOfField()
+            and self.field_double.getNumberOfTuplesExpected()
+            == other.field_double.getNumberOfTuplesExpected()
+        )
+
+    def __array__(self, dtype=None, copy=None) -> numpy.typing.NDArray:
+        # (n_tuples, n_components) view on the values of the field
+        values = self.to_numpy().reshape(-1, len(self.components))
+        return numpy.array(values, dtype=dtype, copy=copy)
+
+    def __wrap(self, result: Any):
+        # Results with one row per tuple are fields on the same support, other results are returned as is
+        if (
+            not isinstance(result, numpy.ndarray)
+            or result.ndim not in (1, 2)
+            or result.shape[0] != self.field_double.getNumberOfTuplesExpected()
+        ):
+            return result
+        num_components = 1 if result.ndim == 1 else result.shape[1]
+        components = self.components
+        if len(components) != num_components:
+            components = [""] * num_components
+        return self.with_values(result, components=components, copy=False)
+
+    def __check_supports(self, fields: List["MEDField"], operation: str) -> None:
+        for other in fields:
+            if not self.same_support(other):
+                raise ValueError(f"Cannot {operation} fields on different supports.")
+
+    def __array_ufunc__(self, ufunc: numpy.ufunc, method: str, *inputs: Any, **kwargs: Any):
+        """NumPy ufuncs on fields give fields on the same support, out= fields are written in place"""
+        out = kwargs.get("out", ())
+        fields = [x for x in inputs + out if isinstance(x, MEDField)]
+        self.__check_supports(fields, f"apply {ufunc.__name__} to")
+        inputs = tuple(x.__array__() if isinstance(x, MEDField) else x for x in inputs)
+        if out:
+            kwargs["out"] = tuple(x.__array__() if isinstance(x, MEDField) else x for x in out)
+        result = getattr(ufunc, method)(*inputs, **kwargs)
+        if out:
+            return out[0] if len(out) == 1 else out
+        if method != "__call__":
+            return result
+        if isinstance(result, tuple):
+            return tuple(self.__wrap(r) for r in result)
+        return self.__wrap(result)
+
+    def __array_function__(self, func: Callable, types: Any, args: Any, kwargs: Any):
+        fields: List[MEDField] = []
+
+        def unwrap(arg: Any):
+            if isinstance(arg, MEDField):
+                fields.append(arg)
+                return arg.__array__()
+            if isinstance(arg, (list, tuple)):
+                return type(arg)(unwrap(a) for a in arg)
+            return arg
+
+        args = unwrap(args)
+        kwargs = {key: unwrap(value) for key, value in kwargs.items()}
+        self.__check_supports(fields, f"apply {func.__name__} to")
+        return self.__wrap(func(*args, **kwargs))
+
+    def __reindexed(self, profile: MEDProfile, fill_value: float) -> "MEDField":
+        # Node field on another profile, nodes missing from this field get fill_value
+        if profile == self.profile:
+            return self
+        own_ids = self.profile.node_ids
+        target_ids = profile.node_ids
+        sorter = numpy.argsort(target_ids, kind="stable")
+        positions = numpy.searchsorted(target_ids, own_ids, sorter=sorter)
+        target_rows = sorter[positions.clip(0, len(target_ids) - 1)]
+        found = target_ids[target_rows] == own_ids
+        values = numpy.full((len(target_ids), len(self.components)), float(fill_value))
+        values[target_rows[found]] = numpy.asarray(self)[found]
+
+        array: mc.DataArrayDouble = mc.DataArrayDouble(values)
+        array.setInfoOnComponents(list(self.components))
+        double_field: mc.MEDCouplingFieldDouble = mc.MEDCouplingFieldDouble.New(
+            mc.ON_NODES, mc.ONE_TIME
+        )
+        double_field.setName(self.name)
+        double_field.setMesh(self.mesh.get_computed_mesh(profile))
+        double_field.setArray(array)
+        timestamp = self.timestamp
+        double_field.setTime(timestamp.time, timestamp.iteration, timestamp.order)
+        return MEDField(self.mesh, double_field, profile)
+
+    def align(
+        self, other: "MEDField", how: str = "union", fill_value: float = 0.0
+    ) -> Tuple["MEDField", "MEDField"]:
+        """Both node fields reindexed on the union or the intersection of their profiles.
+
+        Nodes missing from a field get fill_value. The combined profile is interned in the
+        mesh, so that its computed mesh is built once and the results can be combined with
+        the arithmetic operators.
+        """
+        if how not in ("union", "intersection"):
+            raise ValueError(f"Unknown alignment {how=}, expected 'union' or 'intersection'")
+        if self.mesh is not other.mesh:
+            raise ValueError("Cannot align two fields on different meshes.")
+        if not (self.on_nodes and other.on_nodes):
+            raise NotImplementedError(
+                f"Alignment of {self.name} and {other.name} not on nodes, not yet coded and tested"
+            )
+        if self.profile == other.profile:
+            return self, other
+        if how == "union":
+            node_ids = numpy.union1d(self.profile.node_ids, other.profile.node_ids)
+        else:
+            node_ids = numpy.intersect1d(self.profile.node_ids, other.profile.node_ids)
+        if len(node_ids) == 0:
+            raise ValueError(f"No node in common between {self.name} and {other.name}")
+        profile_array: mc.DataArrayInt = mc.DataArrayInt(
+            numpy.array(node_ids, dtype=numpy.int64, order="C")
+        )
+        digest = MEDProfile(self.mesh, profile_array).fingerprint.split("-")[1]
+        profile_array.setName(f"PFL{how[:5].upper()}{digest[:12]}")
+        profile = self.mesh.intern_profile(profile_array)
+        return self.__reindexed(profile, fill_value), other.__reindexed(profile, fill_value)
+
+    def add(self, other: Any, align: str | None = None, fill_value: float = 0.0):
+        """self + other, with align="union" or "intersection" for fields on other profiles"""
+        if align is not None and isinstance(other, MEDField):
+            aligned, other = self.align(other, align, fill_value)
+            return aligned + other
+        return self + other
+
+    def subtract(self, other: Any, align: str | None = None, fill_value: float = 0.0):
+        """self - other, with align="union" or "intersection" for fields on other profiles"""
+        if align is not None and isinstance(other, MEDField):
+            aligned, other = self.align(other, align, fill_value)
+            return aligned - other
+        return self - other
+
+    def multiply(self, other: Any, align: str | None = None, fill_value: float = 0.0):
+        """self * other, with align="union" or "intersection" for fields on other profiles"""
+        if align is not None and isinstance(other, MEDField):
+            aligned, other = self.align(other, align, fill_value)
+            return aligned * other
+        return self * other
+
+    def deferred(self):
+        """Opt-in deferred arithmetic, see DeferredField"""
+        from .deferred import DeferredField
+
+        return DeferredField.from_field(self)
+
     def __neg__(self):
         return MEDField(self.mesh, self.field_double.negate(), self.profile)
 
@@ -95,30 +294,20 @@ class MEDField:
         if isinstance(other, self.__class__):
             if self.mesh != other.mesh:
                 raise ValueError("Cannot add two fields on different meshes.")
-            if any(p is None for p in (self.profile, other.profile)) and any(
-                p is not None for p in (self.profile, other.profile)
-            ):
+            if (self.profile is None) != (other.profile is None):
                 raise ValueError(
                     "Cannot add two fields if one has a profile and the other does not."
                 )
-            if self.profile is not None and other.profile is not None:
-                if (
-                    self.profile.node_ids_array.getName()
-                    != other.profile.node_ids_array.getName()
-                ):
-                    raise ValueError(
-                        f"Cannot add two fields on different profiles : {self.profile.node_ids_array.getName()=} {other.profile.node_ids_array.getName()=}."
-                    )
+            if self.profile != other.profile:
+                raise ValueError(
+                    f"Cannot add two fields on different profiles : {self.profile.node_ids_array.getName()=} {other.profile.node_ids_array.getName()=}."
+                )
             field_sum = self.field_double + other.field_double
             field_sum.setName(f"{self.name}_plus_{other.name}")
         elif isinstance(other, (int, float)):
             field_sum = self.field_double + other
         else:
-            raise TypeError(
-                "unsupported operand type(s) for +: '{}' and '{}'".format(
-                    self.__class__, type(other)
-                )
-            )
+            return NotImplemented
         return MEDField(self.mesh, field_sum, self.profile)
 
     __radd__ = __add__
@@ -150,14 +339,10 @@ class MEDField:
             field_sub = self.field_double - other.field_double
             field_sub.setName(f"{self.name}_minus_{other.name}")
         elif isinstance(other, (int, float)):
-            field_sum = self.field_double - other
+            field_sub = self.field_double - other
         else:
-            raise TypeError(
-                "unsupported operand type(s) for -: '{}' and '{}'".format(
-                    self.__class__, type(other)
-                )
-            )
-        return MEDField(self.mesh, field_sum, self.profile)
+            return NotImplemented
+        return MEDField(self.mesh, field_sub, self.profile)
 
     def __rsub__(self, other: Any):
         field_sub: mc.MEDCouplingFieldDouble
@@ -167,16 +352,12 @@ class MEDField:
             if self.profile != other.profile:
                 raise ValueError("Cannot subtract two fields on different profiles.")
             field_sub = other.field_double - self.field_double
-            field_sub.setName(f"{self.name}_minus_{other.name}")
+            field_sub.setName(f"{other.name}_minus_{self.name}")
         elif isinstance(other, (int, float)):
-            field_sum = self.field_double.negate() + other
+            field_sub = self.field_double.negate() + other
         else:
-            raise TypeError(
-                "unsupported operand type(s) for -: '{}' and '{}'".format(
-                    self.__class__, type(other)
-                )
-            )
-        return MEDField(self.mesh, field_sum, self.profile)
+            return NotImplemented
+        return MEDField(self.mesh, field_sub, self.profile)
 
     def __isub__(self, other: Any):
         if isinstance(other, self.__class__):
@@ -207,11 +388,7 @@ class MEDField:
         elif isinstance(other, (int, float)):
             field_mul = self.field_double * other
         else:
-            raise TypeError(
-                "unsupported operand type(s) for *: '{}' and '{}'".format(
-                    self.__class__, type(other)
-                )
-            )
+            return NotImplemented
         return MEDField(self.mesh, field_mul, self.profile)
 
     __rmul__ = __mul__
@@ -233,17 +410,176 @@ class MEDField:
             )
         return self
 
+    def tensor_invariants(
+        self,
+        invariants: Sequence[str] = ("von_mises", "tresca", "principal"),
+        name: str | None = None,
+    ):
+        """Field of invariants of the symmetric tensor (XX, YY, ZZ, XY, XZ, YZ) of this field.
+
+        invariants are among "von_mises", "tresca", "principal", "directions", "pressure"
+        and "triaxiality", see TENSOR_INVARIANTS for the components of each one.
+        """
+        component_ids = [
+            list(self.components).index(component)
+            for component in tensor_components(self.components)
+        ]
+        values, components = compute_tensor_invariants(
+            numpy.asarray(self)[:, component_ids], invariants
+        )
+        return self.with_values(
+            values, f"{self.name}_EQ" if name is None else name, components, copy=False
+        )
+
+    def __row_entity_ids(self) -> numpy.typing.NDArray:
+        # Node id (node fields) or cell id (other fields) in the whole mesh of each row of values
+        # For cell fields the profile holds cell ids
+        entity_ids = self.profile.node_ids
+        if self.on_nodes or self.on_cells:
+            return entity_ids
+        offsets = self.field_double.getDiscretization().getOffsetArr(self.field_double.getMesh())
+        return numpy.repeat(entity_ids, numpy.diff(offsets.toNumPyArray()))
+
+    def locate(
+        self, rows: numpy.typing.ArrayLike
+    ) -> Tuple[numpy.typing.NDArray, numpy.typing.NDArray, numpy.typing.NDArray]:
+        """Entity ids in the whole mesh, global numbers and coordinates of rows of values.
+
+        Entities are nodes for node fields and cells otherwise, coordinates are the ones of
+        the nodes, of the cell centers or of the Gauss points.
+        """
+        row_ids = numpy.asarray(rows, dtype=numpy.int64)
+        space_dim = self.mesh.space_dim
+        entity_ids = self.__row_entity_ids()[row_ids]
+        level: int
+        if self.on_nodes:
+            level = 1
+            coordinates = self.mesh.mesh_file.getCoords().toNumPyArray().reshape(-1, space_dim)
+            coordinates = coordinates[entity_ids]
+        else:
+            level = 0
+            coordinates = self.field_double.getLocalizationOfDiscr().toNumPyArray()
+            coordinates = coordinates.reshape(-1, space_dim)[row_ids]
+        numbering = self.mesh.mesh_file.getNumberFieldAtLevel(level)
+        numbers = entity_ids + 1 if numbering is None else numbering.toNumPyArray()[entity_ids]
+        return entity_ids, numbers, coordinates
+
+    def stats(
+        self, components: Sequence[str] | None = None, chunk_size: int = 65536
+    ) -> Dict[str, ComponentStats]:
+        """Minimum and maximum with their location, mean and L2 norm of each component,
+        reduced chunk by chunk in a single pass over the values"""
+        components = list(self.components) if components is None else list(components)
+        unknown = [c for c in components if c not in self.components]
+        if unknown:
+            raise ValueError(f"Unknown components {unknown=} of {self.name}")
+        component_ids = [list(self.components).index(c) for c in components]
+        values = numpy.asarray(self)
+        reduction = StatsReduction(len(component_ids))
+        for start in range(0, len(values), chunk_size):
+            reduction.update(values[start : start + chunk_size, component_ids], row_offset=start)
+        return reduction.results(components, lambda step: self)
+
+    def stats_by_group(
+        self, components: Sequence[str] | None = None
+    ) -> Dict[str, GroupStats]:
+        """Count, sum, mean, minimum and maximum of each component on every group of the mesh.
+
+        A group holds the values of its entities present in the field, nodes of the cells
+        of the group for node fields. All the groups are reduced together from the group
+        incidence of the mesh, without extracting the groups.
+        """
+        components = list(self.components) if components is None else list(components)
+        unknown = [c for c in components if c not in self.components]
+        if unknown:
+            raise ValueError(f"Unknown components {unknown=} of {self.name}")
+        component_ids = [list(self.components).index(c) for c in components]
+        incidence = self.mesh.get_group_incidence(self.on_nodes)
+
+        # Rows of the field sorted by entity, then gathered group after group
+        row_entities = self.__row_entity_ids()
+        num_entities = max(row_entities.max(initial=-1), incidence.entity_ids.max(initial=-1)) + 1
+        rows_by_entity = numpy.argsort(row_entities, kind="stable")
+        rows_per_entity = numpy.bincount(row_entities, minlength=num_entities)
+        entity_starts = numpy.cumsum(rows_per_entity) - rows_per_entity
+        pair_counts = rows_per_entity[incidence.entity_ids]
+        pair_offsets = numpy.zeros(len(pair_counts) + 1, dtype=numpy.int64)
+        numpy.cumsum(pair_counts, out=pair_offsets[1:])
+        within_pair = numpy.arange(pair_offsets[-1]) - numpy.repeat(
+            pair_offsets[:-1], pair_counts
+        )
+        group_rows = rows_by_entity[
+            numpy.repeat(entity_starts[incidence.entity_ids], pair_counts) + within_pair
+        ]
+
+        values = numpy.asarray(self)[group_rows][:, component_ids]
+        counts, sums, minimum, maximum = segment_reductions(
+            values, pair_offsets[incidence.offsets]
+        )
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            means = sums / counts[:, None]
+        return {
+            group_name: GroupStats(
+                int(counts[i]),
+                dict(zip(components, sums[i].tolist())),
+                dict(zip(components, means[i].tolist())),
+                dict(zip(components, minimum[i].tolist())),
+                dict(zip(components, maximum[i].tolist())),
+            )
+            for i, group_name in enumerate(incidence.group_names)
+        }
+
+    @classmethod
+    def from_selection(
+        cls,
+        mesh: MEDMesh,
+        selection: MEDGroupSelection,
+        name: str,
+        values: numpy.typing.NDArray,
+        components: List[str],
+        timestamp: TimeStamp,
+    ):
+        """Node field on a group selection from the values of its nodes"""
+        if len(values) == 0:
+            # DataArrayDouble cannot be built from an empty 2D numpy array
+            array: mc.DataArrayDouble = mc.DataArrayDouble.New()
+            array.alloc(0, len(components))
+        else:
+            # DataArrayDouble adopts the buffer of the numpy array it is built from, give it a private copy
+            array = mc.DataArrayDouble(numpy.array(values, dtype=numpy.float64, order="C"))
+        array.setInfoOnComponents(list(components))
+        double_field: mc.MEDCouplingFieldDouble = mc.MEDCouplingFieldDouble.New(
+            mc.ON_NODES, mc.ONE_TIME
+        )
+        double_field.setName(name)
+        double_field.setMesh(selection.computed_mesh)
+        double_field.setArray(array)
+        double_field.setTime(timestamp.time, timestamp.iteration, timestamp.order)
+        return cls(mesh, double_field, selection.profile)
+
     def extract_group(self, group_name: str):
+        if self.on_nodes:
+            selection = self.mesh.get_group_selection(group_name, self.profile)
+            values = self.to_numpy().reshape(-1, len(self.components))
+            return MEDField.from_selection(
+                self.mesh,
+                selection,
+                self.name,
+                values[selection.node_rows],
+                self.components,
+                self.timestamp,
+            )
+
         group = self.mesh.get_group_by_name(group_name)
+        if group.level != 0:
+            raise NotImplementedError(
+                f"Extraction of cell field {self.name} on group {group_name} of level {group.level}, not yet coded and tested"
+            )
         # https://docs.salome-platform.org/latest/dev/MEDCoupling/tutorial/medcoupling_fielddouble1_en.html#builing-of-a-subpart-of-a-field
-        # TODO : Should distiguish on node or cell field ?
-        # TODO : Handle mesh level ? add a test for group SUP
 
         # Find cells in common (=intersection) between the group and the profile
         whole_mesh: mc.MEDCouplingUMesh = self.mesh.mesh_file.getMeshAtLevel(0)
-        profile_cell_ids: mc.DataArrayInt = whole_mesh.getCellIdsLyingOnNodes(
-            self.profile.node_ids_array, fullyIn=True
-        )
+        profile_cell_ids: mc.DataArrayInt = self.mesh.get_cell_ids_fully_in(self.profile)
         group_cellids_in_profile: mc.DataArrayInt = (
             group.cell_ids_array.buildIntersection(profile_cell_ids)
         )
@@ -266,11 +602,63 @@ class MEDField:
         )
         profile_array.setName(f"{self.profile.node_ids_array.getName()}_{group.name}")
 
-        return MEDField(self.mesh, subfield, MEDProfile(self.mesh, profile_array))
+        return MEDField(self.mesh, subfield, self.mesh.intern_profile(profile_array))
 
-    def apply_expression(self, expr: str):
-        field_expr = self.field_double.applyFuncCompo(len(self.components),expr)
-        return MEDField(self.mesh, field_expr, self.profile)
+    def apply_expression(
+        self,
+        expr: str,
+        components: List[str] | None = None,
+        name: str | None = None,
+        fields: Dict[str, "MEDField"] | None = None,
+        chunk_size: int = 65536,
+        num_threads: int = 1,
+    ):
+        """New field from an expression of the components of this field and of other fields.
+
+        Components of the fields are referenced as ALIAS.COMPONENT with the aliases of fields,
+        this field is also available under its name or through its bare component names.
+        The expression is compiled once and cached, then evaluated with NumPy by chunks of
+        chunk_size tuples on num_threads threads. The result has a single component unless
+        components are given or unit vectors (IVec, JVec...) are used.
+        """
+        compiled = compile_expression(expr)
+        fields = {self.name: self, **(fields or {})}
+        columns: Dict[Tuple[str | None, str], numpy.typing.NDArray] = {}
+        for alias, component in compiled.variables:
+            med_field = self if alias is None else fields.get(alias)
+            if med_field is None:
+                raise ValueError(f"Unknown field {alias} in expression {expr}")
+            if component not in med_field.components:
+                raise ValueError(
+                    f"Unknown component {component} of {med_field.name} in expression {expr}"
+                )
+            if not self.same_support(med_field):
+                raise ValueError(f"Cannot apply {expr} to fields on different supports.")
+            component_id = list(med_field.components).index(component)
+            columns[(alias, component)] = numpy.asarray(med_field)[
+                :, component_id : component_id + 1
+            ]
+
+        if components is None:
+            components = list(self.components) if compiled.num_unit_vectors else [""]
+        num_tuples: int = self.field_double.getNumberOfTuplesExpected()
+        values = numpy.empty((num_tuples, len(components)))
+
+        def evaluate_chunk(start: int) -> None:
+            stop = min(start + chunk_size, num_tuples)
+            chunk_columns = {key: column[start:stop] for key, column in columns.items()}
+            values[start:stop] = compiled.evaluate(chunk_columns, stop - start, len(components))
+
+        starts = range(0, num_tuples, chunk_size)
+        if num_threads > 1:
+            with ThreadPoolExecutor(max_workers=num_threads) as executor:
+                list(executor.map(evaluate_chunk, starts))
+        else:
+            for start in starts:
+                evaluate_chunk(start)
+        return self.with_values(
+            values, self.name if name is None else name, components, copy=False
+        )
 
 
 class MEDFieldEvol:
@@ -283,17 +671,30 @@ class MEDFieldEvol:
         mesh: MEDMesh,
         file_field_multits: mc.MEDFileFieldMultiTS,
         profile: MEDProfile | None = None,
+        timestep_cache: TimestepCache | None = None,
     ):
         self.mesh = mesh
         self.file_field_multits = file_field_multits
         self.profile = profile
-        self.computed_mesh: mc.MEDCouplingUMesh = self.__compute_mesh()
+        self.timestep_cache = timestep_cache
+        self.__computed_mesh: mc.MEDCouplingUMesh | None = None
+        # (iteration, order) -> position in file_field_multits, and times sorted with their positions
+        self.__timestep_positions: Dict[Tuple[int, int], int] = {}
+        self.__sorted_times: List[float] = []
+        self.__sorted_positions: List[int] = []
+
+    @property
+    def computed_mesh(self) -> mc.MEDCouplingUMesh:
+        if self.__computed_mesh is None:
+            self.__computed_mesh = self.__compute_mesh()
+        return self.__computed_mesh
 
     @property
     def max_field_level(self):
         # https://docs.salome-platform.org/latest/dev/MEDCoupling/developer/classMEDCoupling_1_1MEDFileAnyTypeFieldMultiTSWithoutSDA.html#a33f3edf8d4ebe1796549715551275c06
+        iteration, order, _ = self.file_field_multits.getTimeSteps()[0]
         field_abs_dim, available_levels = self.file_field_multits.getNonEmptyLevels(
-            1, 1, self.mesh.name
+            iteration, order, self.mesh.name
         )
 
         max_level: int
@@ -311,34 +712,22 @@ class MEDFieldEvol:
         field_type: int = self.file_field_multits.getTypesOfFieldAvailable()[0][
             0
         ]  # TODO understand this and make it more general, probably it is mc.ON_CELLS etc
-        mesh_level = 0  # TODO make this more general or extract as a parameter
 
         # https://docs.salome-platform.org/latest/dev/MEDCoupling/developer/medcouplingpyexamples.html#py_mcfield_loadfile_partial
         field_vals: mc.DataArrayDouble
         field_prf: mc.DataArrayInt
 
-        # the user wants to retrieve the binding (cell ids or node ids) with the whole mesh on which the partial field lies partially on.
-        field_vals, field_prf = self.file_field_multits.getFieldWithProfile(
-            field_type, 1, 1, self.max_field_level, self.mesh.mesh_file
-        )
-        whole_mesh: mc.MEDCouplingUMesh = self.mesh.mesh_file.getMeshAtLevel(mesh_level)
+        # Use the first available timestep, selective loading may have skipped (1, 1)
+        iteration, order, _ = self.file_field_multits.getTimeSteps()[0]
 
-        # Submesh including only cells needed to have node ids in the profile
-        profile_cell_ids: mc.DataArrayInt = whole_mesh.getCellIdsLyingOnNodes(
-            field_prf, fullyIn=True
-        )
-        computed_mesh: mc.MEDCouplingUMesh = whole_mesh.buildPartOfMySelf(
-            profile_cell_ids, keepCoords=True
-        )
+        # Fields opened in lazy mode only have their headers in memory
+        self.__load(self.file_field_multits.getTimeStep(iteration, order))
 
-        # Also remove (orphan) nodes if they are not requested by the profile (they might be needed at other levels)
-        # This will make sure that the computed mesh has exactly the right number of nodes (mandatory for checkConsistencyLight)
-        field_prf_o2n: mc.DataArrayInt = field_prf.invertArrayN2O2O2N(
-            whole_mesh.getNumberOfNodes()
+        # the user wants to retrieve the binding (cell ids or node ids) with the whole mesh on which the partial field lies partially on.
+        field_vals, field_prf = self.file_field_multits.getFieldWithProfile(
+            field_type, iteration, order, self.max_field_level, self.mesh.mesh_file
         )
-        computed_mesh.renumberNodes(field_prf_o2n, len(field_prf))
-        computed_mesh.setName(self.mesh.mesh_file.getName())
-        return computed_mesh
+        return self.mesh.get_computed_mesh(MEDProfile(self.mesh, field_prf))
 
     @property
     def name(self) -> str:
@@ -376,18 +765,23 @@ class MEDFieldEvol:
         field_vals: mc.DataArrayDouble
         field_prf: mc.DataArrayInt
 
+        # Fields opened in lazy mode only have their headers in memory
+        self.__load(field_1ts)
+
         # the user wants to retrieve the binding (cell ids or node ids) with the whole mesh on which the partial field lies partially on.
         field_vals, field_prf = field_1ts.getFieldWithProfile(
             field_type, mesh_level, self.mesh.mesh_file
         )
 
         # it is possible to rebuild field obtained in first approach starting from second approach
-        double_field: mc.MEDCouplingFieldDouble = mc.MEDCouplingFieldDouble.New(
-            field_type, mc.ONE_TIME
-        )
+        double_field: mc.MEDCouplingFieldDouble
+        if field_type == mc.ON_GAUSS_PT:
+            # Gauss points need the localizations stored in the file, MEDCoupling builds them
+            double_field = field_1ts.field(self.mesh.mesh_file)
+        else:
+            double_field = mc.MEDCouplingFieldDouble.New(field_type, mc.ONE_TIME)
+            double_field.setMesh(self.computed_mesh)
         double_field.setName(field_1ts.getName())
-
-        double_field.setMesh(self.computed_mesh)
         profile_names = field_1ts.getPflsReallyUsed()
         if len(profile_names) == 1:
             field_prf.setName(profile_names[0])
@@ -398,43 +792,508 @@ class MEDFieldEvol:
         else:
             profile_name = f"PFL{field_1ts.getName()}"
             field_prf.setName(profile_name)
-        double_field.setArray(field_vals)
+        if field_type != mc.ON_GAUSS_PT:
+            double_field.setArray(field_vals)
 
         iteration, order, time = field_1ts.getTime()
         double_field.setTime(time, iteration, order)
         double_field.checkConsistencyLight()
-        return MEDField(self.mesh, double_field, MEDProfile(self.mesh, field_prf))
+        return MEDField(self.mesh, double_field, self.mesh.intern_profile(field_prf))
+
+    def __timestep_index(self) -> Dict[Tuple[int, int], int]:
+        # Rebuilt only if file_field_multits was modified outside of add_field
+        if len(self.__timestep_positions) != self.file_field_multits.getNumberOfTS():
+            self.__timestep_positions = {}
+            self.__sorted_times = []
+            self.__sorted_positions = []
+            for iteration, order, time in self.file_field_multits.getTimeSteps():
+                self.__index_timestep(iteration, order, time)
+        return self.__timestep_positions
+
+    def __index_timestep(self, iteration: int, order: int, time: float) -> None:
+        pos = len(self.__timestep_positions)
+        self.__timestep_positions[(iteration, order)] = pos
+        insert_at = bisect.bisect_right(self.__sorted_times, time)
+        self.__sorted_times.insert(insert_at, time)
+        self.__sorted_positions.insert(insert_at, pos)
+
+    def has_timestep(self, iteration: int, order: int) -> bool:
+        return (iteration, order) in self.__timestep_index()
+
+    def get_nearest_timestep(self, time: float) -> TimeStamp:
+        """Timestep with the time closest to time, the earliest one on ties"""
+        self.__timestep_index()
+        if not self.__sorted_times:
+            raise ValueError(f"No timestep in field_evol {self.name}")
+        insert_at = bisect.bisect_left(self.__sorted_times, time)
+        candidates = [i for i in (insert_at - 1, insert_at) if 0 <= i < len(self.__sorted_times)]
+        nearest = min(candidates, key=lambda i: abs(self.__sorted_times[i] - time))
+        iteration, order, nearest_time = self.file_field_multits.getTimeStepAtPos(
+            self.__sorted_positions[nearest]
+        ).getTime()
+        return TimeStamp(iteration, order, nearest_time)
 
     def get_field_at_timestep(self, iteration: int, order: int):
-        return self.__build_field(self.file_field_multits.getTimeStep(iteration, order))
-
-    def extract_group(self, group_name: str):
-        extracted_fieldevol: mc.MEDFileFieldMultiTS = mc.MEDFileFieldMultiTS.New()
-        extracted_fieldevol.setName(f"{self.name}_{group_name}")
-        for _, field in self.field_by_timestep.items():
-            subfield: MEDField = field.extract_group(group_name)
-            extracted_fieldevol.appendFieldProfile(
-                subfield.field_double,
-                self.mesh.mesh_file,
-                0,
-                subfield.profile.node_ids_array,
+        pos = self.__timestep_index().get((iteration, order))
+        if pos is None:
+            raise ValueError(f"Timestep ({iteration}, {order}) not present in field_evol")
+        return self.__build_field(self.file_field_multits[pos])
+
+    def __read_values(
+        self, field_1ts: mc.MEDFileField1TS, rows: numpy.typing.NDArray | None = None
+    ) -> numpy.typing.NDArray:
+        """Values of a timestep as a (n_entities, n_components) array without building a field,
+        arrays read from file for this only are unloaded afterwards (unless they are managed
+        by the timestep cache). With rows, only these rows of the stored array are copied."""
+        field_type: int = self.file_field_multits.getTypesOfFieldAvailable()[0][0]
+        mesh_level = 0  # TODO make this more general or extract as a parameter
+        unloaded_size: int = field_1ts.getHeapMemorySize()
+        self.__load(field_1ts)
+
+        values: numpy.typing.NDArray
+        if rows is None:
+            field_vals: mc.DataArrayDouble
+            field_vals, _ = field_1ts.getFieldWithProfile(field_type, mesh_level, self.mesh.mesh_file)
+            values = field_vals.toNumPyArray().reshape(
+                field_vals.getNumberOfTuples(), field_vals.getNumberOfComponents()
             )
-        return MEDFieldEvol(self.mesh, extracted_fieldevol, subfield.profile)
+        else:
+            stored_vals: mc.DataArrayDouble = field_1ts.getUndergroundDataArray()
+            values = stored_vals.toNumPyArray().reshape(
+                stored_vals.getNumberOfTuples(), stored_vals.getNumberOfComponents()
+            )[rows]
+
+        if self.timestep_cache is None and field_1ts.getHeapMemorySize() > unloaded_size:
+            field_1ts.unloadArraysWithoutDataLoss()
+        return values
+
+    def __timestep_positions_of(self, timesteps: Sequence[TimeStamp] | None) -> List[int]:
+        if timesteps is None:
+            return list(range(self.file_field_multits.getNumberOfTS()))
+        timestep_index = self.__timestep_index()
+        missing = [ts for ts in timesteps if (ts.iteration, ts.order) not in timestep_index]
+        if missing:
+            raise ValueError(f"Timesteps {missing=} not present in field_evol")
+        return [timestep_index[(ts.iteration, ts.order)] for ts in timesteps]
+
+    def __component_ids_of(self, components: Sequence[str] | None) -> List[int]:
+        all_components = list(self.components)
+        if components is None:
+            return list(range(len(all_components)))
+        missing = [component for component in components if component not in all_components]
+        if missing:
+            raise ValueError(f"Components {missing=} not in {all_components=}")
+        return [all_components.index(component) for component in components]
+
+    def __stored_profile(self) -> MEDProfile:
+        """Node profile of the stored timestep arrays, read from the first timestep"""
+        field_1ts: mc.MEDFileField1TS = self.file_field_multits[0]
+        self.__load(field_1ts)
+        field_prf: mc.DataArrayInt
+        _, field_prf = field_1ts.getFieldWithProfile(mc.ON_NODES, 0, self.mesh.mesh_file)
+        profile_names = field_1ts.getPflsReallyUsed()
+        field_prf.setName(profile_names[0] if profile_names else f"PFL{field_1ts.getName()}")
+        return self.mesh.intern_profile(field_prf)
 
-    def add_field(self, med_field: MEDField) -> None:
-        if med_field.timestamp in self.field_by_timestep:
+    def __entity_rows(
+        self,
+        node_ids: Sequence[int] | None,
+        cell_ids: Sequence[int] | None,
+        group: str | None,
+    ) -> numpy.typing.NDArray:
+        """Rows of the stored timestep arrays holding the requested nodes or cells"""
+        if sum(selection is not None for selection in (node_ids, cell_ids, group)) != 1:
+            raise ValueError("Expected exactly one of node_ids, cell_ids or group")
+        types_of_field = self.file_field_multits.getTypesOfFieldAvailable()[0]
+        if types_of_field == [mc.ON_NODES] and cell_ids is None:
+            profile_node_ids = self.__stored_profile().node_ids
+            rows_of_nodes = numpy.full(self.mesh.num_nodes, -1)
+            rows_of_nodes[profile_node_ids] = numpy.arange(len(profile_node_ids))
+            if group is not None:
+                # Nodes of the group lying in the profile
+                rows = rows_of_nodes[self.mesh.get_group_node_ids(group)]
+                return rows[rows >= 0]
+            rows = rows_of_nodes[numpy.asarray(node_ids)]
+            if numpy.any(rows < 0):
+                raise ValueError(f"Some {node_ids=} are not in the profile of {self.name}")
+            return rows
+        if types_of_field == [mc.ON_CELLS] and node_ids is None:
+            if self.file_field_multits.getPfls():
+                raise NotImplementedError(
+                    f"History of cell field {self.name} with profiles, not yet coded and tested"
+                )
+            if group is not None:
+                cell_group = self.mesh.get_group_by_name(group)
+                if cell_group.level != 0:
+                    raise NotImplementedError(
+                        f"History of cell field {self.name} on group {group} of level {cell_group.level}, not yet coded and tested"
+                    )
+                return cell_group.cell_ids
+            return numpy.asarray(cell_ids)
+        raise NotImplementedError(
+            f"History of {self.name} with {types_of_field=}, not yet coded and tested"
+        )
+
+    def history(
+        self,
+        node_ids: Sequence[int] | None = None,
+        cell_ids: Sequence[int] | None = None,
+        group: str | None = None,
+        timesteps: Sequence[TimeStamp] | None = None,
+        components: Sequence[str] | None = None,
+    ) -> numpy.typing.NDArray:
+        """Time history of some nodes (node field) or cells (cell field), as an array of shape
+        (n_steps, n_selected, n_components). Only the selected rows of each timestep are
+        copied, no field is built."""
+        rows = self.__entity_rows(node_ids, cell_ids, group)
+        positions = self.__timestep_positions_of(timesteps)
+        component_ids = self.__component_ids_of(components)
+        history = numpy.empty((len(positions), len(rows), len(component_ids)))
+        for step, pos in enumerate(positions):
+            history[step] = self.__read_values(self.file_field_multits[pos], rows)[:, component_ids]
+        return history
+
+    def to_numpy_stack(
+        self,
+        timesteps: Sequence[TimeStamp] | None = None,
+        components: Sequence[str] | None = None,
+    ) -> numpy.typing.NDArray:
+        """Contiguous array of shape (n_steps, n_entities, n_components), filled one
+        timestep at a time without building the fields"""
+        positions = self.__timestep_positions_of(timesteps)
+        component_ids = self.__component_ids_of(components)
+        stack: numpy.typing.NDArray | None = None
+        for step, pos in enumerate(positions):
+            values = self.__read_values(self.file_field_multits[pos])
+            if stack is None:
+                stack = numpy.empty((len(positions), values.shape[0], len(component_ids)))
+            elif values.shape[0] != stack.shape[1]:
+                raise ValueError(
+                    f"Timesteps of {self.name} have different number of entities, cannot be stacked"
+                )
+            stack[step] = values[:, component_ids]
+        if stack is None:
+            return numpy.empty((0, 0, len(component_ids)))
+        return stack
+
+    def envelope(
+        self, kind: str = "max", components: Sequence[str] | None = None
+    ) -> Tuple[MEDField, MEDField]:
+        """Envelope over all the timesteps, read one at a time.
+
+        kind is "min", "max" or "absmax" (value of largest magnitude, sign kept). Returns the
+        envelope field and a field holding the iteration of the timestep reaching it, both
+        with timestamp (-1, -1, 0.0) and ready for MEDFieldEvol.from_fields.
+        """
+        if kind not in ("min", "max", "absmax"):
+            raise ValueError(f"Unknown envelope {kind=}, expected 'min', 'max' or 'absmax'")
+        component_ids = self.__component_ids_of(components)
+        envelope: numpy.typing.NDArray | None = None
+        arg_iteration: numpy.typing.NDArray | None = None
+        for pos in range(self.file_field_multits.getNumberOfTS()):
+            field_1ts: mc.MEDFileField1TS = self.file_field_multits[pos]
+            iteration, _, _ = field_1ts.getTime()
+            values = self.__read_values(field_1ts)[:, component_ids]
+            if envelope is None or arg_iteration is None:
+                envelope = values.copy()
+                arg_iteration = numpy.full(values.shape, float(iteration))
+                continue
+            if kind == "min":
+                improved = values < envelope
+            elif kind == "max":
+                improved = values > envelope
+            else:
+                improved = numpy.abs(values) > numpy.abs(envelope)
+            envelope[improved] = values[improved]
+            arg_iteration[improved] = iteration
+        if envelope is None or arg_iteration is None:
+            raise ValueError(f"No timestep in field_evol {self.name}")
+
+        template = self.__build_field(self.file_field_multits[0])
+        template.set_timestamp(-1, -1, 0.0)
+        selected_components = [list(self.components)[i] for i in component_ids]
+        return (
+            template.with_values(envelope, f"{self.name}_{kind}", selected_components),
+            template.with_values(arg_iteration, f"{self.name}_{kind}_it", selected_components),
+        )
+
+    def tensor_invariants(
+        self,
+        invariants: Sequence[str] = ("von_mises", "tresca", "principal"),
+        name: str | None = None,
+    ) -> "MEDFieldEvol":
+        """MEDField.tensor_invariants of every timestep, read one at a time"""
+        return MEDFieldEvol.from_fields(
+            self.mesh,
+            (
+                med_field.tensor_invariants(invariants, f"{self.name}_EQ" if name is None else name)
+                for med_field in self.iter_fields()
+            ),
+        )
+
+    def stats(self, components: Sequence[str] | None = None) -> Dict[str, ComponentStats]:
+        """MEDField.stats over all the timesteps, read one at a time, the extremes hold the
+        timestamp they are reached at"""
+        component_ids = self.__component_ids_of(components)
+        reduction = StatsReduction(len(component_ids))
+        for pos in range(self.file_field_multits.getNumberOfTS()):
+            values = self.__read_values(self.file_field_multits[pos])
+            reduction.update(values[:, component_ids], step=pos)
+        return reduction.results(
+            [list(self.components)[i] for i in component_ids],
+            lambda pos: self.__build_field(self.file_field_multits[pos]),
+        )
+
+    def get_field_at_time(self, time: float | Sequence[float], method: str = "linear"):
+        """Field at any time, method is "linear" (no extrapolation), "nearest" or "previous".
+
+        For a single time a MEDField with timestamp (-1, -1, time) is returned, for a sequence
+        of times a new MEDFieldEvol resampled on them (iteration and order i + 1).
+        """
+        times = numpy.atleast_1d(numpy.asarray(time, dtype=numpy.float64))
+        if numpy.ndim(time) == 0:
+            med_field = self.__interpolate(times, method)[0]
+            med_field.set_timestamp(-1, -1, float(times[0]))
+            return med_field
+        med_fields = self.__interpolate(times, method)
+        for pos, (med_field, field_time) in enumerate(zip(med_fields, times)):
+            med_field.set_timestamp(pos + 1, pos + 1, float(field_time))
+        return MEDFieldEvol.from_fields(self.mesh, med_fields)
+
+    def __interpolate(self, times: numpy.typing.NDArray, method: str) -> List[MEDField]:
+        """Fields at the times of a 1D float array"""
+        if method not in ("linear", "nearest", "previous"):
             raise ValueError(
-                f"Timestamp {med_field.timestamp} already present in field_evol"
+                f"Unknown interpolation {method=}, expected 'linear', 'nearest' or 'previous'"
+            )
+        self.__timestep_index()
+        sorted_times = numpy.asarray(self.__sorted_times)
+        if len(sorted_times) == 0:
+            raise ValueError(f"No timestep in field_evol {self.name}")
+        last = len(sorted_times) - 1
+
+        # Bracketing timesteps (indices in sorted_times) and weight of the upper one
+        lower = numpy.searchsorted(sorted_times, times, side="right") - 1
+        if method == "previous":
+            if numpy.any(lower < 0):
+                raise ValueError(f"Times before the first timestep {sorted_times[0]}")
+            upper = lower
+            weight = numpy.zeros(len(times))
+        elif method == "nearest":
+            right = numpy.searchsorted(sorted_times, times, side="left").clip(0, last)
+            left = (right - 1).clip(0, last)
+            take_left = numpy.abs(times - sorted_times[left]) <= numpy.abs(sorted_times[right] - times)
+            lower = upper = numpy.where(take_left, left, right)
+            weight = numpy.zeros(len(times))
+        else:
+            if numpy.any((times < sorted_times[0]) | (times > sorted_times[last])):
+                raise ValueError(
+                    f"Times outside of [{sorted_times[0]}, {sorted_times[last]}], cannot extrapolate"
+                )
+            lower = lower.clip(0, last)
+            upper = (lower + 1).clip(0, last)
+            delta = sorted_times[upper] - sorted_times[lower]
+            weight = numpy.divide(
+                times - sorted_times[lower], delta, out=numpy.zeros(len(times)), where=delta > 0
             )
-        self.file_field_multits.appendFieldProfile(
-            med_field.field_double,
-            self.mesh.mesh_file,
-            med_field.field_relative_dim,
-            med_field.profile.node_ids_array,
+
+        template = self.__build_field(self.file_field_multits[0])
+        loaded: Dict[int, numpy.typing.NDArray] = {}
+        med_fields: List[MEDField] = []
+        for lower_id, upper_id, upper_weight in zip(lower, upper, weight):
+            # Only the bracketing timesteps are kept, times are usually increasing
+            loaded = {i: loaded[i] for i in (lower_id, upper_id) if i in loaded}
+            for i in (lower_id, upper_id):
+                if i not in loaded:
+                    loaded[i] = self.__read_values(
+                        self.file_field_multits[self.__sorted_positions[i]]
+                    )
+            values = loaded[lower_id]
+            if upper_weight > 0.0:
+                values = values + upper_weight * (loaded[upper_id] - values)
+            med_fields.append(template.with_values(values))
+        return med_fields
+
+    def __timestep_key(self, field_1ts: mc.MEDFileField1TS) -> Tuple[int, int, int]:
+        # The cache keeps file_field_multits alive with the entry, its address is not reused
+        iteration, order, _ = field_1ts.getTime()
+        return (self.file_field_multits.getHiddenCppPointerAsLongLong(), iteration, order)
+
+    def __load(self, field_1ts: mc.MEDFileField1TS) -> None:
+        if self.timestep_cache is not None:
+            self.timestep_cache.load(
+                self.__timestep_key(field_1ts), field_1ts, self.file_field_multits
+            )
+        else:
+            field_1ts.loadArraysIfNecessary()
+
+    def __unload(self, field_1ts: mc.MEDFileField1TS) -> None:
+        if self.timestep_cache is not None:
+            self.timestep_cache.discard(self.__timestep_key(field_1ts))
+        field_1ts.unloadArraysWithoutDataLoss()
+
+    def iter_fields(self, prefetch: int = 0) -> Iterator[MEDField]:
+        """Yield the field of each timestep, reading the arrays of one timestep at a time.
+
+        Arrays which can be read again from file are unloaded once the consumer moves on,
+        with prefetch > 0 the next timesteps are read ahead on a background thread.
+        """
+        num_timesteps: int = self.file_field_multits.getNumberOfTS()
+        if prefetch <= 0:
+            for pos in range(num_timesteps):
+                field_1ts: mc.MEDFileField1TS = self.file_field_multits[pos]
+                try:
+                    yield self.__build_field(field_1ts)
+                finally:
+                    self.__unload(field_1ts)
+            return
+
+        pending: Deque[Tuple[mc.MEDFileField1TS, Future]] = deque()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            try:
+                for pos in range(num_timesteps):
+                    while len(pending) <= prefetch and pos + len(pending) < num_timesteps:
+                        next_1ts: mc.MEDFileField1TS = self.file_field_multits[pos + len(pending)]
+                        pending.append((next_1ts, executor.submit(next_1ts.loadArraysIfNecessary)))
+                    field_1ts, loaded = pending.popleft()
+                    loaded.result()
+                    try:
+                        yield self.__build_field(field_1ts)
+                    finally:
+                        self.__unload(field_1ts)
+            finally:
+                for field_1ts, loaded in pending:
+                    loaded.result()
+                    self.__unload(field_1ts)
+
+    def extract_group(self, group_name: str):
+        if self.file_field_multits.getTypesOfFieldAvailable()[0] == [mc.ON_NODES]:
+            return self.extract_groups([group_name])[group_name]
+        # Extracted timesteps of cell or Gauss point fields cannot be read back from a node profile
+        raise NotImplementedError(
+            f"Extraction of {self.name} not on nodes on group {group_name}, not yet coded and tested"
         )
+
+    def extract_groups(self, group_names: Sequence[str]) -> Dict[str, "MEDFieldEvol"]:
+        """Extract several groups reading each timestep once, the group selections are
+        computed once and shared with the mesh (see MEDMesh.get_group_selection).
+        Groups without node in the profile give empty fields, as extract_group does."""
+        if not group_names:
+            return {}
+        if self.file_field_multits.getTypesOfFieldAvailable()[0] != [mc.ON_NODES]:
+            return {group_name: self.extract_group(group_name) for group_name in group_names}
+
+        profile = self.__stored_profile()
+        selections = {
+            group_name: self.mesh.get_group_selection(group_name, profile)
+            for group_name in group_names
+        }
+        # Rows of all the groups are copied at once from each timestep, then split per group
+        rows = numpy.concatenate(
+            [selection.node_rows for selection in selections.values()]
+        ).astype(numpy.int64, copy=False)
+        offsets = numpy.cumsum([0] + [len(selection.node_rows) for selection in selections.values()])
+        components = list(self.components)
+        fields_by_group: Dict[str, List[MEDField]] = {group_name: [] for group_name in selections}
+        for field_1ts in self.file_field_multits:
+            values = self.__read_values(field_1ts, rows)
+            timestamp = TimeStamp(*field_1ts.getTime())
+            for (group_name, selection), start, stop in zip(
+                selections.items(), offsets[:-1], offsets[1:]
+            ):
+                fields_by_group[group_name].append(
+                    MEDField.from_selection(
+                        self.mesh, selection, self.name, values[start:stop], components, timestamp
+                    )
+                )
+        return {
+            group_name: MEDFieldEvol.from_fields(self.mesh, med_fields)
+            for group_name, med_fields in fields_by_group.items()
+        }
+
+    def add_field(self, med_field: MEDField) -> None:
+        self.add_fields([med_field])
+
+    def add_fields(self, med_fields: Iterable[MEDField]) -> None:
+        """Append several timesteps, profiles are merged and checked once for all of them"""
+        med_fields = list(med_fields)
+        new_timesteps = set()
+        for med_field in med_fields:
+            timestamp = med_field.timestamp
+            key = (timestamp.iteration, timestamp.order)
+            if key in new_timesteps or self.has_timestep(*key):
+                raise ValueError(
+                    f"Timestamp {med_field.timestamp} already present in field_evol"
+                )
+            new_timesteps.add(key)
+
+        for med_field in med_fields:
+            self.file_field_multits.appendFieldProfile(
+                med_field.field_double,
+                self.mesh.mesh_file,
+                med_field.field_relative_dim,
+                med_field.profile.node_ids_array,
+            )
+            timestamp = med_field.timestamp
+            self.__index_timestep(timestamp.iteration, timestamp.order, timestamp.time)
         self.file_field_multits.zipPflsNames()
         self.file_field_multits.checkGlobsCoherency() 
 
+    @classmethod
+    def from_fields(cls, mesh: MEDMesh, med_fields: Iterable[MEDField]) -> "MEDFieldEvol":
+        """New field evolution with one timestep per field, named after the first field"""
+        med_fields = list(med_fields)
+        if not med_fields:
+            raise ValueError("Cannot build a field evolution without fields")
+        file_field_multits: mc.MEDFileFieldMultiTS = mc.MEDFileFieldMultiTS.New()
+        file_field_multits.setName(med_fields[0].name)
+        fieldevol = cls(mesh, file_field_multits, med_fields[0].profile)
+        fieldevol.add_fields(med_fields)
+        return fieldevol
+
+    @classmethod
+    def from_numpy(
+        cls,
+        mesh: MEDMesh,
+        name: str,
+        times: Sequence[float],
+        values: numpy.typing.NDArray,
+        components: List[str],
+        profile: MEDProfile | None = None,
+    ) -> "MEDFieldEvol":
+        """Node field evolution from an array of shape (n_steps, n_nodes, n_components).
+        Timestep i has iteration and order i + 1, profile defaults to all the mesh nodes."""
+        values = numpy.asarray(values, dtype=numpy.float64)
+        if values.ndim != 3 or values.shape[0] != len(times) or values.shape[2] != len(components):
+            raise ValueError(
+                f"Expected values of shape ({len(times)}, n_nodes, {len(components)}), got {values.shape=}"
+            )
+        if profile is None:
+            profile_array: mc.DataArrayInt = mc.DataArrayInt.Range(0, mesh.num_nodes, 1)
+            profile_array.setName(f"PFL{name}")
+            profile = mesh.intern_profile(profile_array)
+        if values.shape[1] != len(profile.node_ids_array):
+            raise ValueError(
+                f"Expected {len(profile.node_ids_array)} nodes in the profile, got {values.shape[1]}"
+            )
+
+        computed_mesh = mesh.get_computed_mesh(profile)
+        med_fields: List[MEDField] = []
+        for pos, time in enumerate(times):
+            array: mc.DataArrayDouble = mc.DataArrayDouble(
+                numpy.array(values[pos], dtype=numpy.float64, order="C")
+            )
+            array.setInfoOnComponents(components)
+            double_field: mc.MEDCouplingFieldDouble = mc.MEDCouplingFieldDouble.New(
+                mc.ON_NODES, mc.ONE_TIME
+            )
+            double_field.setName(name)
+            double_field.setMesh(computed_mesh)
+            double_field.setArray(array)
+            double_field.setTime(float(time), pos + 1, pos + 1)
+            med_fields.append(MEDField(mesh, double_field, profile))
+        return cls.from_fields(mesh, med_fields)
+
     @property
     def field_by_timestep(self) -> Dict[TimeStamp, MEDField]:
         return {
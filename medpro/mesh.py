@@ -1,25 +1,51 @@
+from dataclasses import dataclass
+import hashlib
+
 import medcoupling as mc
 
+import numpy
 import numpy.typing
 from numpy.lib import recfunctions as rfn
-from typing import Dict, List, TypeVar
+from typing import Dict, List, Tuple, TypeVar
 
 TMEDMesh = TypeVar("TMEDMesh", bound="MEDMesh")
 
 
 class MEDProfile:
+    """Ids of the entities a field lies on, equal to any profile with the same ids on the
+    same mesh. The ids are not expected to change, see MEDMesh.intern_profile"""
+
     def __init__(self, mesh: TMEDMesh, node_ids_array: mc.DataArrayInt):
         self.mesh = mesh
         self.node_ids_array = node_ids_array
+        self.__fingerprint: str | None = None
 
     @property
     def node_ids(self) -> numpy.typing.NDArray:
         return self.node_ids_array.toNumPyArray()
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash of the node ids, equal for profiles with the same content, computed once"""
+        if self.__fingerprint is None:
+            node_ids = self.node_ids
+            digest = hashlib.blake2b(node_ids.tobytes(), digest_size=16).hexdigest()
+            self.__fingerprint = f"{len(node_ids)}-{digest}"
+        return self.__fingerprint
+
+    def __eq__(self, other: object):
+        if not isinstance(other, MEDProfile):
+            return NotImplemented
+        return self is other or (
+            self.mesh is other.mesh and self.fingerprint == other.fingerprint
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self.mesh), self.fingerprint))
     
     @property
     def cell_ids_fully_in(self) -> numpy.typing.NDArray:
-        whole_mesh: mc.MEDCouplingUMesh = self.mesh.mesh_file.getMeshAtLevel(0)
-        return whole_mesh.getCellIdsLyingOnNodes(self.node_ids_array, fullyIn=True).toNumPyArray()
+        return self.mesh.get_cell_ids_fully_in(self).toNumPyArray()
     
     @property
     def cell_ids_not_fully_in(self) -> numpy.typing.NDArray:
@@ -27,16 +53,52 @@ class MEDProfile:
         return whole_mesh.getCellIdsLyingOnNodes(self.node_ids_array, fullyIn=False).toNumPyArray()
 
 
+@dataclass(frozen=True)
+class MEDGroupSelection:
+    """Part of a node field profile lying on a group, computed once and applied to any
+    field on the same profile by taking its node_rows"""
+
+    cell_ids_array: mc.DataArrayInt
+    node_rows: numpy.typing.NDArray
+    computed_mesh: mc.MEDCouplingUMesh
+    profile: MEDProfile
+
+
+@dataclass(frozen=True)
+class MEDGroupIncidence:
+    """Sparse group x entity incidence of all the groups of a mesh, in compressed rows:
+    the sorted entity ids of group i are entity_ids[offsets[i] : offsets[i + 1]]"""
+
+    group_names: Tuple[str, ...]
+    offsets: numpy.typing.NDArray
+    entity_ids: numpy.typing.NDArray
+
+
+def _fetched_node_ids(
+    mesh_file: mc.MEDFileUMesh, level: int, ids: mc.DataArrayInt
+) -> mc.DataArrayInt:
+    # Sorted ids of the nodes of entities of a level, the entities are nodes on level 1
+    if level == 1:
+        node_ids: mc.DataArrayInt = ids.deepCopy()
+        node_ids.sort()
+        return node_ids
+    return mesh_file.getMeshAtLevel(level)[ids].computeFetchedNodeIds()
+
+
 class MEDGroup:
     def __init__(
         self,
         mesh: TMEDMesh,
         cell_ids_array: mc.DataArrayInt,
         cell_numbers_array: mc.DataArrayInt,
+        level: int = 0,
     ):
+        """Entities of a group on one level: cells of the mesh at this level (0, -1...) or
+        nodes (1), cell_ids_array then holds node ids"""
         self.mesh = mesh
         self.cell_ids_array = cell_ids_array
         self.cell_numbers_array = cell_numbers_array
+        self.level = level
 
     @property
     def name(self) -> str:
@@ -59,16 +121,11 @@ class MEDGroup:
         return self.cell_numbers_array.toNumPyArray()
 
     def to_profile(self) -> MEDProfile:
-        whole_mesh: mc.MEDCouplingUMesh = self.mesh.mesh_file.getMeshAtLevel(0)
-        submesh_group: mc.MEDCouplingUMesh = whole_mesh[self.cell_ids_array]
-        group_ids_new: mc.DataArrayInt
-        new_num_group_ids: int
-        group_ids_new, new_num_group_ids = submesh_group.getNodeIdsInUse()
-        profile_array: mc.DataArrayInt = group_ids_new.invertArrayO2N2N2O(
-            new_num_group_ids
+        profile_array: mc.DataArrayInt = _fetched_node_ids(
+            self.mesh.mesh_file, self.level, self.cell_ids_array
         )
         profile_array.setName(self.name)
-        return MEDProfile(self.mesh, profile_array)
+        return self.mesh.intern_profile(profile_array)
 
 
 class MEDMesh:
@@ -76,12 +133,48 @@ class MEDMesh:
     https://docs.salome-platform.org/latest/dev/MEDCoupling/developer/classMEDCoupling_1_1MEDFileUMesh.html
     """
 
-    def __init__(self, mesh_file: mc.MEDFileUMesh):
-        self.mesh_file = mesh_file
+    def __init__(
+        self,
+        mesh_file: mc.MEDFileUMesh | None = None,
+        file_name: str | None = None,
+        mesh_name: str | None = None,
+    ):
+        if mesh_file is None and (file_name is None or mesh_name is None):
+            raise ValueError("Either mesh_file or both file_name and mesh_name are required.")
+        self._mesh_file = mesh_file
+        self._file_name = file_name
+        self._mesh_name = mesh_name
+        # Keyed by profile fingerprint, shared by all the fields using the same profile
+        self.__cell_ids_fully_in: Dict[str, mc.DataArrayInt] = {}
+        self.__computed_meshes: Dict[str, mc.MEDCouplingUMesh] = {}
+        self.__group_selections: Dict[Tuple[str, str], MEDGroupSelection] = {}
+        # Keyed by on_nodes
+        self.__group_incidences: Dict[bool, MEDGroupIncidence] = {}
+        # Interned profiles, keyed by fingerprint
+        self.__profiles: Dict[str, MEDProfile] = {}
+
+    @classmethod
+    def from_file(cls, file_name: str, mesh_name: str) -> "MEDMesh":
+        """Mesh whose arrays are only read from file_name on first access"""
+        return cls(file_name=file_name, mesh_name=mesh_name)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._mesh_file is not None
+
+    @property
+    def mesh_file(self) -> mc.MEDFileUMesh:
+        if self._mesh_file is None:
+            self._mesh_file = mc.MEDFileMesh.New(self._file_name, self._mesh_name)
+        return self._mesh_file
 
     @property
     def name(self) -> str:
-        return self.mesh_file.getName()
+        if self._mesh_file is None:
+            # The constructor requires mesh_name without mesh_file
+            assert self._mesh_name is not None
+            return self._mesh_name
+        return self._mesh_file.getName()
     
     @name.setter
     def name(self, value: str) -> None:
@@ -116,7 +209,128 @@ class MEDMesh:
         group_level = group_levels[0]        
         ids: mc.DataArrayInt = self.mesh_file.getGroupArr(group_level, group_name, False)
         labels: mc.DataArrayInt = self.mesh_file.getGroupArr(group_level, group_name, True)
-        return MEDGroup(self, ids, labels)
+        return MEDGroup(self, ids, labels, group_level)
+
+    def get_group_node_ids(self, group_name: str) -> numpy.typing.NDArray:
+        """Sorted ids of the nodes of a group, whatever the levels it is defined on"""
+        incidence = self.get_group_incidence(True)
+        if group_name not in incidence.group_names:
+            raise ValueError(f"Group {group_name=} not found in mesh {self.name}")
+        pos = incidence.group_names.index(group_name)
+        return incidence.entity_ids[incidence.offsets[pos] : incidence.offsets[pos + 1]]
+
+    def intern_profile(self, node_ids_array: mc.DataArrayInt) -> MEDProfile:
+        """The profile of this mesh with these ids, shared by all the fields using it.
+        The first array (and name) registered for some ids is kept, later copies are dropped"""
+        profile = MEDProfile(self, node_ids_array)
+        interned = self.__profiles.get(profile.fingerprint)
+        # Profiles are written under their name, a named array replaces an unnamed one
+        if interned is None or (
+            not interned.node_ids_array.getName() and node_ids_array.getName()
+        ):
+            self.__profiles[profile.fingerprint] = profile
+            return profile
+        return interned
+
+    def get_cell_ids_fully_in(self, profile: MEDProfile) -> mc.DataArrayInt:
+        """Ids of the cells having all their nodes in the profile, computed once per profile"""
+        key = profile.fingerprint
+        if key not in self.__cell_ids_fully_in:
+            whole_mesh: mc.MEDCouplingUMesh = self.mesh_file.getMeshAtLevel(0)
+            self.__cell_ids_fully_in[key] = whole_mesh.getCellIdsLyingOnNodes(
+                profile.node_ids_array, fullyIn=True
+            )
+        return self.__cell_ids_fully_in[key]
+
+    def get_computed_mesh(self, profile: MEDProfile) -> mc.MEDCouplingUMesh:
+        """Submesh of the cells lying on the profile, with exactly the nodes of the profile.
+        Computed once per profile and shared by all the fields using it"""
+        key = profile.fingerprint
+        if key not in self.__computed_meshes:
+            whole_mesh: mc.MEDCouplingUMesh = self.mesh_file.getMeshAtLevel(0)
+
+            # Submesh including only cells needed to have node ids in the profile
+            computed_mesh: mc.MEDCouplingUMesh = whole_mesh.buildPartOfMySelf(
+                self.get_cell_ids_fully_in(profile), keepCoords=True
+            )
+
+            # Also remove (orphan) nodes if they are not requested by the profile (they might be needed at other levels)
+            # This will make sure that the computed mesh has exactly the right number of nodes (mandatory for checkConsistencyLight)
+            profile_o2n: mc.DataArrayInt = profile.node_ids_array.invertArrayN2O2O2N(
+                whole_mesh.getNumberOfNodes()
+            )
+            computed_mesh.renumberNodes(profile_o2n, len(profile.node_ids_array))
+            computed_mesh.setName(self.name)
+            self.__computed_meshes[key] = computed_mesh
+        return self.__computed_meshes[key]
+
+    def get_group_selection(self, group_name: str, profile: MEDProfile) -> MEDGroupSelection:
+        """Nodes of the entities of the group lying fully in the profile, on each level the
+        group is defined on (nodes, cells, faces...), the matching rows of a node field on the
+        profile and the cells of level 0 lying on these nodes. Computed once per group and profile"""
+        key = (group_name, profile.fingerprint)
+        if key not in self.__group_selections:
+            rows_of_nodes = numpy.full(self.num_nodes, -1)
+            rows_of_nodes[profile.node_ids] = numpy.arange(len(profile.node_ids_array))
+            node_ids: List[numpy.typing.NDArray] = []
+            for level in self.mesh_file.getGrpNonEmptyLevelsExt(group_name):
+                ids: mc.DataArrayInt = self.mesh_file.getGroupArr(level, group_name, False)
+                if level != 1:
+                    # Entities of the group having all their nodes in the profile
+                    group_mesh: mc.MEDCouplingUMesh = self.mesh_file.getMeshAtLevel(level)
+                    ids = ids[
+                        group_mesh[ids].getCellIdsLyingOnNodes(profile.node_ids_array, True)
+                    ]
+                node_ids.append(_fetched_node_ids(self.mesh_file, level, ids).toNumPyArray())
+            group_node_ids = (
+                numpy.unique(numpy.concatenate(node_ids))
+                if node_ids
+                else numpy.empty(0, dtype=numpy.int64)
+            )
+            group_node_ids = group_node_ids[rows_of_nodes[group_node_ids] >= 0]
+
+            profile_array: mc.DataArrayInt = mc.DataArrayInt(
+                numpy.array(group_node_ids, dtype=numpy.int64)
+            )
+            profile_array.setName(f"{profile.node_ids_array.getName()}_{group_name}")
+            selection_profile = self.intern_profile(profile_array)
+            self.__group_selections[key] = MEDGroupSelection(
+                self.get_cell_ids_fully_in(selection_profile),
+                rows_of_nodes[group_node_ids],
+                self.get_computed_mesh(selection_profile),
+                selection_profile,
+            )
+        return self.__group_selections[key]
+
+    def get_group_incidence(self, on_nodes: bool) -> MEDGroupIncidence:
+        """Nodes (on_nodes) or cells of level 0 of every group, computed once per mesh.
+        The nodes of a group of cells are the nodes of its cells, at any level"""
+        if on_nodes not in self.__group_incidences:
+            group_names: Tuple[str, ...] = tuple(self.mesh_file.getGroupsNames())
+            members: List[numpy.typing.NDArray] = []
+            for group_name in group_names:
+                entity_ids: List[numpy.typing.NDArray] = []
+                for level in self.mesh_file.getGrpNonEmptyLevelsExt(group_name):
+                    ids: mc.DataArrayInt = self.mesh_file.getGroupArr(level, group_name, False)
+                    if on_nodes:
+                        entity_ids.append(
+                            _fetched_node_ids(self.mesh_file, level, ids).toNumPyArray()
+                        )
+                    elif level == 0:
+                        entity_ids.append(ids.toNumPyArray())
+                members.append(
+                    numpy.unique(numpy.concatenate(entity_ids))
+                    if entity_ids
+                    else numpy.empty(0, dtype=numpy.int64)
+                )
+            offsets = numpy.zeros(len(members) + 1, dtype=numpy.int64)
+            numpy.cumsum([len(ids) for ids in members], out=offsets[1:])
+            self.__group_incidences[on_nodes] = MEDGroupIncidence(
+                group_names,
+                offsets,
+                numpy.concatenate(members) if members else numpy.empty(0, dtype=numpy.int64),
+            )
+        return self.__group_incidences[on_nodes]
 
     def get_cell_ids_in_boundingbox(
         self,
@@ -0,0 +1,159 @@
+import json
+import os
+import pathlib
+from typing import List
+
+import medcoupling as mc
+import numpy
+import numpy.typing
+
+from .field import MEDFieldEvol, TimeStamp
+from .mesh import MEDProfile
+
+
+class HistorySidecar:
+    """Node-major copy of a node field evolution, stored next to the MED file.
+
+    Values are stored as a (n_nodes, n_steps, n_components) .npy file and the node ids
+    as a .nodes.npy file next to it, both memory-mapped on reopen, so that the time history
+    of a node is one contiguous read. The sidecar is invalidated when the modification time
+    or the size of the source file change, or when the field evolution it is opened for has
+    other timesteps, components or profiles (a selective reading for instance).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        values: numpy.typing.NDArray,
+        node_ids: numpy.typing.NDArray,
+        timesteps: List[TimeStamp],
+        components: List[str],
+    ):
+        self.path = path
+        self.values = values
+        self.node_ids = node_ids
+        self.timesteps = timesteps
+        self.components = components
+        self.__rows_of_nodes = numpy.full(int(node_ids.max(initial=-1)) + 1, -1)
+        self.__rows_of_nodes[node_ids] = numpy.arange(len(node_ids))
+
+    @staticmethod
+    def __source_signature(source_file_name: str) -> dict:
+        stat = os.stat(source_file_name)
+        return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+    @staticmethod
+    def __field_signature(fieldevol: MEDFieldEvol) -> dict:
+        # Only headers are used, profiles are read with the headers of the fields
+        multits: mc.MEDFileFieldMultiTS = fieldevol.file_field_multits
+        return {
+            "field_name": fieldevol.name,
+            "timesteps": [[ts.iteration, ts.order, ts.time] for ts in fieldevol.timesteps],
+            "components": list(fieldevol.components),
+            "profiles": [
+                [name, MEDProfile(fieldevol.mesh, multits.getProfile(name)).fingerprint]
+                for name in multits.getPfls()
+            ],
+        }
+
+    @staticmethod
+    def __nodes_path(path: str) -> str:
+        return path.removesuffix(".npy") + ".nodes.npy"
+
+    @classmethod
+    def build(
+        cls,
+        fieldevol: MEDFieldEvol,
+        path: str | pathlib.Path,
+        source_file_name: str | pathlib.Path,
+        chunk_steps: int = 64,
+    ) -> "HistorySidecar":
+        """Transpose fieldevol into path, reading chunk_steps timesteps at a time"""
+        path = pathlib.Path(path).as_posix()
+        source_file_name = pathlib.Path(source_file_name).as_posix()
+        if fieldevol.file_field_multits.getTypesOfFieldAvailable()[0] != [mc.ON_NODES]:
+            raise NotImplementedError(
+                f"History sidecar of {fieldevol.name} not on nodes, not yet coded and tested"
+            )
+        timesteps = fieldevol.timesteps
+        components = list(fieldevol.components)
+        node_ids = fieldevol.get_field_at_timestep(
+            timesteps[0].iteration, timesteps[0].order
+        ).profile.node_ids
+
+        values = numpy.lib.format.open_memmap(
+            path + ".tmp",
+            mode="w+",
+            dtype=numpy.float64,
+            shape=(len(node_ids), len(timesteps), len(components)),
+        )
+        for start in range(0, len(timesteps), chunk_steps):
+            chunk = fieldevol.to_numpy_stack(timesteps=timesteps[start : start + chunk_steps])
+            values[:, start : start + len(chunk), :] = chunk.transpose(1, 0, 2)
+        values.flush()
+        del values
+        os.replace(path + ".tmp", path)
+        nodes_path = cls.__nodes_path(path)
+        with open(nodes_path + ".tmp", "wb") as nodes_file:
+            numpy.save(nodes_file, numpy.asarray(node_ids, dtype=numpy.int64))
+        os.replace(nodes_path + ".tmp", nodes_path)
+
+        # Metadata is written last, a sidecar is only valid once all its files are complete
+        metadata = {
+            "source": cls.__source_signature(source_file_name),
+            **cls.__field_signature(fieldevol),
+        }
+        with open(path + ".json", "w") as metadata_file:
+            json.dump(metadata, metadata_file)
+        return cls(
+            path,
+            numpy.load(path, mmap_mode="r"),
+            numpy.load(nodes_path, mmap_mode="r"),
+            timesteps,
+            components,
+        )
+
+    @classmethod
+    def open(
+        cls,
+        path: str | pathlib.Path,
+        source_file_name: str | pathlib.Path,
+        fieldevol: MEDFieldEvol,
+    ) -> "HistorySidecar | None":
+        """Memory-map an existing sidecar of fieldevol, None if it is missing, out of date or
+        holds another field, other timesteps or another profile"""
+        path = pathlib.Path(path).as_posix()
+        try:
+            with open(path + ".json") as metadata_file:
+                metadata = json.load(metadata_file)
+        except (OSError, ValueError):
+            return None
+        signature = cls.__field_signature(fieldevol)
+        if any(metadata.get(key) != value for key, value in signature.items()):
+            return None
+        if metadata.get("source") != cls.__source_signature(
+            pathlib.Path(source_file_name).as_posix()
+        ):
+            return None
+        try:
+            values = numpy.load(path, mmap_mode="r")
+            node_ids = numpy.load(cls.__nodes_path(path), mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        return cls(
+            path,
+            values,
+            node_ids,
+            [TimeStamp(*timestep) for timestep in metadata["timesteps"]],
+            metadata["components"],
+        )
+
+    def history(self, node_ids: numpy.typing.ArrayLike) -> numpy.typing.NDArray:
+        """Same as MEDFieldEvol.history(node_ids=...), shape (n_steps, n_nodes, n_components)"""
+        ids = numpy.asarray(node_ids, dtype=numpy.int64)
+        if numpy.any(ids < 0) or numpy.any(ids >= len(self.__rows_of_nodes)):
+            raise ValueError(f"Some {node_ids=} are not in the sidecar {self.path}")
+        rows = self.__rows_of_nodes[ids]
+        if numpy.any(rows < 0):
+            raise ValueError(f"Some {node_ids=} are not in the sidecar {self.path}")
+        return numpy.ascontiguousarray(self.values[rows].transpose(1, 0, 2))
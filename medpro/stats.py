@@ -0,0 +1,140 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, List, Sequence, Tuple
+
+import numpy
+import numpy.typing
+
+if TYPE_CHECKING:
+    from .field import MEDField, TimeStamp
+
+
+@dataclass(frozen=True)
+class Extremum:
+    value: float
+    # Node or cell id in the whole mesh, global number of the entity in the file
+    entity_id: int
+    number: int
+    coordinates: Tuple[float, ...]
+    timestamp: "TimeStamp"
+
+
+@dataclass(frozen=True)
+class ComponentStats:
+    minimum: Extremum
+    maximum: Extremum
+    mean: float
+    l2_norm: float
+
+
+@dataclass(frozen=True)
+class GroupStats:
+    count: int
+    sum: Dict[str, float]
+    mean: Dict[str, float]
+    minimum: Dict[str, float]
+    maximum: Dict[str, float]
+
+
+def segment_reductions(
+    values: numpy.typing.NDArray, offsets: numpy.typing.NDArray
+) -> Tuple[
+    numpy.typing.NDArray, numpy.typing.NDArray, numpy.typing.NDArray, numpy.typing.NDArray
+]:
+    """Count, sum, minimum and maximum of the (n_rows, n_components) values of each segment
+    values[offsets[i] : offsets[i + 1]], NaN for the extremes of empty segments"""
+    counts = numpy.diff(offsets)
+    num_components = values.shape[1]
+    sums = numpy.zeros((len(counts), num_components))
+    minimum = numpy.full((len(counts), num_components), numpy.nan)
+    maximum = numpy.full((len(counts), num_components), numpy.nan)
+    non_empty = counts > 0
+    if non_empty.any():
+        # Empty segments have no rows, each reduceat segment runs to the next non empty one
+        starts = offsets[:-1][non_empty]
+        sums[non_empty] = numpy.add.reduceat(values, starts, axis=0)
+        minimum[non_empty] = numpy.minimum.reduceat(values, starts, axis=0)
+        maximum[non_empty] = numpy.maximum.reduceat(values, starts, axis=0)
+    return counts, sums, minimum, maximum
+
+
+class StatsReduction:
+    """Running minimum, maximum, sum and sum of squares of each component.
+
+    Updated one chunk of rows (or one timestep) at a time, the rows and steps of the extremes
+    are kept so that only them have to be located afterwards. Ties keep the first occurrence.
+    """
+
+    def __init__(self, num_components: int):
+        self.minimum = numpy.full(num_components, numpy.inf)
+        self.maximum = numpy.full(num_components, -numpy.inf)
+        self.min_rows = numpy.zeros(num_components, dtype=numpy.int64)
+        self.max_rows = numpy.zeros(num_components, dtype=numpy.int64)
+        self.min_steps = numpy.zeros(num_components, dtype=numpy.int64)
+        self.max_steps = numpy.zeros(num_components, dtype=numpy.int64)
+        self.total = numpy.zeros(num_components)
+        self.squares = numpy.zeros(num_components)
+        self.count = 0
+
+    def update(self, values: numpy.typing.NDArray, step: int = 0, row_offset: int = 0) -> None:
+        """Reduce (n_rows, n_components) values, rows start at row_offset in the field"""
+        if len(values) == 0:
+            return
+        columns = numpy.arange(values.shape[1])
+        min_rows = values.argmin(axis=0)
+        minimum = values[min_rows, columns]
+        improved = minimum < self.minimum
+        self.minimum[improved] = minimum[improved]
+        self.min_rows[improved] = min_rows[improved] + row_offset
+        self.min_steps[improved] = step
+
+        max_rows = values.argmax(axis=0)
+        maximum = values[max_rows, columns]
+        improved = maximum > self.maximum
+        self.maximum[improved] = maximum[improved]
+        self.max_rows[improved] = max_rows[improved] + row_offset
+        self.max_steps[improved] = step
+
+        self.total += values.sum(axis=0)
+        self.squares += numpy.einsum("ij,ij->j", values, values)
+        self.count += len(values)
+
+    @property
+    def mean(self) -> numpy.typing.NDArray:
+        return self.total / self.count if self.count else numpy.full_like(self.total, numpy.nan)
+
+    @property
+    def l2_norm(self) -> numpy.typing.NDArray:
+        return numpy.sqrt(self.squares)
+
+    def results(
+        self, components: Sequence[str], field_of_step: Callable[[int], "MEDField"]
+    ) -> Dict[str, ComponentStats]:
+        """ComponentStats of each component, field_of_step(step) is the field of the rows of step"""
+        if self.count == 0:
+            raise ValueError(f"No values to compute the stats of {components=}")
+        extrema: List[List[Extremum]] = []
+        for values, steps, rows in (
+            (self.minimum, self.min_steps, self.min_rows),
+            (self.maximum, self.max_steps, self.max_rows),
+        ):
+            located: List[Extremum | None] = [None] * len(components)
+            for step in numpy.unique(steps):
+                med_field = field_of_step(int(step))
+                selected = numpy.flatnonzero(steps == step)
+                entity_ids, numbers, coordinates = med_field.locate(rows[selected])
+                for i, component_id in enumerate(selected):
+                    located[component_id] = Extremum(
+                        float(values[component_id]),
+                        int(entity_ids[i]),
+                        int(numbers[i]),
+                        tuple(float(x) for x in coordinates[i]),
+                        med_field.timestamp,
+                    )
+            extrema.append([extremum for extremum in located if extremum is not None])
+        mean, l2_norm = self.mean, self.l2_norm
+        return {
+            component: ComponentStats(
+                extrema[0][i], extrema[1][i], float(mean[i]), float(l2_norm[i])
+            )
+            for i, component in enumerate(components)
+        }
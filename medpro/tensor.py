@@ -0,0 +1,99 @@
+from typing import Dict, List, Sequence, Tuple
+
+import numpy
+import numpy.typing
+
+
+# Components of each invariant, named as in the SIEQ fields of code_aster
+TENSOR_INVARIANTS: Dict[str, List[str]] = {
+    "von_mises": ["VMIS"],
+    "tresca": ["TRESCA"],
+    "principal": ["PRIN_1", "PRIN_2", "PRIN_3"],
+    "directions": [f"VECT_{i}_{axis}" for i in (1, 2, 3) for axis in "XYZ"],
+    "pressure": ["PRES"],
+    "triaxiality": ["TRIAX"],
+}
+
+TENSOR_SUFFIXES: Tuple[str, ...] = ("XX", "YY", "ZZ", "XY", "XZ", "YZ")
+
+
+def tensor_components(components: Sequence[str]) -> List[str]:
+    """The six components XX, YY, ZZ, XY, XZ, YZ of the first symmetric tensor in components"""
+    for component in components:
+        if component.endswith("XX"):
+            names = [component[:-2] + suffix for suffix in TENSOR_SUFFIXES]
+            if all(name in components for name in names):
+                return names
+    raise ValueError(f"No symmetric tensor (XX, YY, ZZ, XY, XZ, YZ) in {components=}")
+
+
+def _principal_values(tensors: numpy.typing.NDArray) -> numpy.typing.NDArray:
+    # Closed form eigenvalues of symmetric 3x3 matrices, ascending
+    xx, yy, zz, xy, xz, yz = tensors.T
+    mean = (xx + yy + zz) / 3.0
+    off_diagonal = xy**2 + xz**2 + yz**2
+    scale = numpy.sqrt(
+        ((xx - mean) ** 2 + (yy - mean) ** 2 + (zz - mean) ** 2 + 2.0 * off_diagonal) / 6.0
+    )
+    safe_scale = numpy.where(scale > 0.0, scale, 1.0)
+    bxx, byy, bzz = (xx - mean) / safe_scale, (yy - mean) / safe_scale, (zz - mean) / safe_scale
+    bxy, bxz, byz = xy / safe_scale, xz / safe_scale, yz / safe_scale
+    half_det = (
+        bxx * (byy * bzz - byz**2) - bxy * (bxy * bzz - byz * bxz) + bxz * (bxy * byz - byy * bxz)
+    ) / 2.0
+    angle = numpy.arccos(numpy.clip(half_det, -1.0, 1.0)) / 3.0
+    largest = mean + 2.0 * scale * numpy.cos(angle)
+    smallest = mean + 2.0 * scale * numpy.cos(angle + 2.0 * numpy.pi / 3.0)
+    return numpy.stack([smallest, 3.0 * mean - largest - smallest, largest], axis=1)
+
+
+def compute_tensor_invariants(
+    tensors: numpy.typing.NDArray, invariants: Sequence[str]
+) -> Tuple[numpy.typing.NDArray, List[str]]:
+    """Invariants of (n, 6) symmetric tensors ordered XX, YY, ZZ, XY, XZ, YZ.
+
+    Returns the (n, k) values and the names of their k components, principal values are
+    ascending and the principal directions are the matching unit eigenvectors.
+    """
+    unknown = [invariant for invariant in invariants if invariant not in TENSOR_INVARIANTS]
+    if unknown:
+        raise ValueError(f"Unknown {unknown=}, expected some of {list(TENSOR_INVARIANTS)}")
+    tensors = numpy.asarray(tensors, dtype=numpy.float64).reshape(-1, 6)
+    xx, yy, zz, xy, xz, yz = tensors.T
+    trace = xx + yy + zz
+
+    principal: numpy.typing.NDArray | None = None
+    directions: numpy.typing.NDArray | None = None
+    if "directions" in invariants:
+        matrices = tensors[:, [0, 3, 4, 3, 1, 5, 4, 5, 2]].reshape(-1, 3, 3)
+        principal, eigenvectors = numpy.linalg.eigh(matrices)
+        directions = eigenvectors.transpose(0, 2, 1).reshape(-1, 9)
+    elif "principal" in invariants or "tresca" in invariants:
+        principal = _principal_values(tensors)
+
+    von_mises = numpy.sqrt(
+        0.5 * ((xx - yy) ** 2 + (yy - zz) ** 2 + (zz - xx) ** 2) + 3.0 * (xy**2 + xz**2 + yz**2)
+    )
+    columns: List[numpy.typing.NDArray] = []
+    components: List[str] = []
+    for invariant in invariants:
+        if invariant == "von_mises":
+            columns.append(von_mises[:, None])
+        elif invariant == "tresca":
+            assert principal is not None
+            columns.append((principal[:, 2] - principal[:, 0])[:, None])
+        elif invariant == "principal":
+            assert principal is not None
+            columns.append(principal)
+        elif invariant == "directions":
+            assert directions is not None
+            columns.append(directions)
+        elif invariant == "pressure":
+            columns.append(-trace[:, None] / 3.0)
+        elif invariant == "triaxiality":
+            triaxiality = numpy.divide(
+                trace / 3.0, von_mises, out=numpy.zeros_like(trace), where=von_mises > 0.0
+            )
+            columns.append(triaxiality[:, None])
+        components.extend(TENSOR_INVARIANTS[invariant])
+    return numpy.concatenate(columns, axis=1), components
@@ -0,0 +1,61 @@
+import medpro
+import numpy as np
+
+
+def test_timestep_cache(ex_dir):
+    cache = medpro.TimestepCache(max_bytes=2000)
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed", lazy=True, timestep_cache=cache)
+    fp_ref = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed")
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    depl_evol_ref = fp_ref.fieldevols_by_name["reslin__DEPL"]
+
+    for iteration in (1, 2, 3, 1, 1):
+        depl = depl_evol.get_field_at_timestep(iteration, iteration)
+        depl_ref = depl_evol_ref.get_field_at_timestep(iteration, iteration)
+        assert np.array_equal(depl.to_numpy(), depl_ref.to_numpy())
+
+    # The computed mesh reads the first timestep through the cache too
+    assert cache.stats.misses == 4
+    assert cache.stats.hits == 2
+    assert cache.stats.evictions >= 2
+    assert cache.stats.loaded_bytes <= 2000
+
+    cache.clear()
+    assert cache.stats.loaded_bytes == 0
+
+
+def test_timestep_cache_shared(ex_dir):
+    cache = medpro.TimestepCache(max_bytes=10**9)
+    for _ in range(5):
+        # Timesteps of a closed file are never mistaken for those of the next one
+        fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed", lazy=True, timestep_cache=cache)
+        depl = fp.fieldevols_by_name["reslin__DEPL"].get_field_at_timestep(2, 2)
+        assert np.isfinite(depl.to_numpy()).all()
+        del fp, depl
+    assert cache.stats.hits == 0
+    assert cache.stats.misses == 10
+
+
+def test_timestep_cache_eager(ex_dir):
+    # Without lazy, timestep arrays are still only read through the cache
+    cache = medpro.TimestepCache(max_bytes=2000)
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed", timestep_cache=cache)
+    fp_ref = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed")
+    assert fp.meshes_by_name["mesh"].is_loaded
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    loaded = [field_1ts.getHeapMemorySize() for field_1ts in depl_evol.file_field_multits]
+    assert loaded == [
+        field_1ts.getHeapMemorySize()
+        for field_1ts in medpro.MEDFilePost(
+            ex_dir / "box_with_deplevol.rmed", lazy=True
+        ).fieldevols_by_name["reslin__DEPL"].file_field_multits
+    ]
+
+    for iteration in (1, 2, 3):
+        depl = depl_evol.get_field_at_timestep(iteration, iteration)
+        depl_ref = fp_ref.fieldevols_by_name["reslin__DEPL"].get_field_at_timestep(
+            iteration, iteration
+        )
+        assert np.array_equal(depl.to_numpy(), depl_ref.to_numpy())
+    assert cache.stats.loaded_bytes <= 2000
+    assert cache.stats.evictions >= 1
@@ -0,0 +1,36 @@
+import medpro
+import numpy as np
+import pytest
+
+
+def test_combine_load_cases(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed")
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    cases = [depl_evol.get_field_at_timestep(ts.iteration, ts.order) for ts in depl_evol.timesteps]
+    stack = np.stack([np.asarray(case) for case in cases])
+    coefficients = np.array([[1.35, 1.5, 0.0], [1.0, 0.0, 1.0], [1.0, -1.0, 0.5], [0.0, 0.0, -2.0]])
+    expected = np.einsum("kc,cnj->knj", coefficients, stack)
+
+    combinations = medpro.combine_load_cases(coefficients, cases, name="COMB", chunk_size=5)
+    assert combinations.name == "COMB"
+    assert [ts.iteration for ts in combinations.timesteps] == [1, 2, 3, 4]
+    assert np.allclose(combinations.to_numpy_stack(), expected)
+    assert np.allclose(
+        medpro.combine_load_cases(coefficients, depl_evol).to_numpy_stack(), expected
+    )
+
+    envelopes = medpro.load_case_envelopes(
+        coefficients, depl_evol, kinds=("min", "max", "absmax"), name="COMB", chunk_size=7
+    )
+    minimum, arg_minimum = envelopes["min"]
+    assert minimum.name == "COMB_min"
+    assert arg_minimum.name == "COMB_min_comb"
+    assert minimum.timestamp == medpro.TimeStamp(-1, -1, 0.0)
+    assert np.allclose(np.asarray(minimum), expected.min(axis=0))
+    assert np.array_equal(np.asarray(arg_minimum), expected.argmin(axis=0) + 1.0)
+    assert np.allclose(np.asarray(envelopes["max"][0]), expected.max(axis=0))
+    absmax = np.take_along_axis(expected, np.abs(expected).argmax(axis=0)[None], axis=0)[0]
+    assert np.allclose(np.asarray(envelopes["absmax"][0]), absmax)
+
+    with pytest.raises(ValueError):
+        medpro.combine_load_cases(coefficients[:, :2], cases)
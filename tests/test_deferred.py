@@ -0,0 +1,39 @@
+import medpro
+import numpy as np
+import pytest
+
+
+def test_deferred_combination(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed")
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    depl1 = depl_evol.get_field_at_timestep(1, 1)
+    depl2 = depl_evol.get_field_at_timestep(2, 2)
+    depl3 = depl_evol.get_field_at_timestep(3, 3)
+
+    expr = 1.35 * depl1.deferred() + depl2 * 1.5 - depl3.deferred() / 2.0
+    assert isinstance(expr, medpro.DeferredField)
+    combination = expr.evaluate(chunk_size=7)
+
+    expected = 1.35 * depl1.to_numpy() + 1.5 * depl2.to_numpy() - depl3.to_numpy() / 2.0
+    assert np.allclose(combination.to_numpy(), expected)
+    assert list(combination.components) == list(depl1.components)
+    assert combination.profile is depl1.profile
+    assert combination.timestamp == depl1.timestamp
+    assert combination.name == "reslin__DEPL_plus_reslin__DEPL_minus_reslin__DEPL"
+    assert expr.evaluate(name="combination").name == "combination"
+
+    # Eager operands on the left are deferred as well
+    assert np.allclose((depl2 - depl1.deferred()).evaluate().to_numpy(), depl2.to_numpy() - depl1.to_numpy())
+    assert np.allclose((-depl1.deferred()).evaluate().to_numpy(), -depl1.to_numpy())
+
+
+def test_deferred_checks(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_profile.rmed")
+    depl = fp.fieldevols_by_name["reslin__DEPL"].get_field_at_timestep(1, 1)
+    other = medpro.MEDFilePost(ex_dir / "box_profile.rmed")
+    other_depl = other.fieldevols_by_name["reslin__DEPL"].get_field_at_timestep(1, 1)
+
+    with pytest.raises(ValueError):
+        depl.deferred() + other_depl
+    with pytest.raises(TypeError):
+        depl.deferred() + "depl"
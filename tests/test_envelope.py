@@ -0,0 +1,46 @@
+import os
+import tempfile
+
+import medpro
+import numpy as np
+import pytest
+
+
+def test_envelope(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed")
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    stack = depl_evol.to_numpy_stack()
+    iterations = np.array([ts.iteration for ts in depl_evol.timesteps])
+
+    depl_max, depl_max_it = depl_evol.envelope("max")
+    assert depl_max.name == "reslin__DEPL_max"
+    assert np.array_equal(depl_max.to_numpy(), stack.max(axis=0))
+    assert np.array_equal(depl_max_it.to_numpy(), iterations[stack.argmax(axis=0)])
+
+    depl_min, _ = depl_evol.envelope("min", components=["DZ"])
+    assert list(depl_min.components) == ["DZ"]
+    assert np.array_equal(depl_min.to_numpy(), stack[:, :, 2].min(axis=0))
+
+    depl_absmax, _ = depl_evol.envelope("absmax")
+    expected = np.take_along_axis(stack, np.abs(stack).argmax(axis=0)[None], axis=0)[0]
+    assert np.array_equal(depl_absmax.to_numpy(), expected)
+
+    with pytest.raises(ValueError):
+        depl_evol.envelope("mean")
+
+
+def test_envelope_write(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed")
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    depl_max, depl_max_it = depl_evol.envelope("absmax")
+
+    fpnew = medpro.MEDFilePost()
+    fpnew.add_mesh(fp.meshes_by_name["mesh"])
+    fpnew.add_fieldevol(medpro.MEDFieldEvol.from_fields(depl_evol.mesh, [depl_max]))
+    fpnew.add_fieldevol(medpro.MEDFieldEvol.from_fields(depl_evol.mesh, [depl_max_it]))
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath = os.path.join(tempdir, "envelope.rmed")
+        fpnew.write(tmpfilepath)
+        fpread = medpro.MEDFilePost(tmpfilepath)
+        assert "reslin__DEPL_absmax" in fpread.fieldevols_by_name
+        assert "reslin__DEPL_absmax_it" in fpread.fieldevols_by_name
@@ -0,0 +1,51 @@
+import medpro
+import numpy as np
+import pytest
+
+
+def test_apply_expression(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed")
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    depl1 = depl_evol.get_field_at_timestep(1, 1)
+    depl2 = depl_evol.get_field_at_timestep(2, 2)
+    values1, values2 = np.asarray(depl1), np.asarray(depl2)
+
+    norm = depl2.apply_expression("sqrt(DX^2+DY^2)", name="NORM", chunk_size=5, num_threads=2)
+    assert norm.name == "NORM"
+    assert list(norm.components) == [""]
+    assert np.allclose(norm.to_numpy(), np.sqrt(values2[:, 0] ** 2 + values2[:, 1] ** 2))
+    assert np.asarray(depl2).tolist() == values2.tolist()
+
+    swapped = depl2.apply_expression("DY*IVec+DX*JVec+2*DZ*KVec")
+    assert list(swapped.components) == list(depl2.components)
+    assert np.allclose(np.asarray(swapped), values2[:, [1, 0, 2]] * [1.0, 1.0, 2.0])
+
+    combined = depl1.apply_expression(
+        "max(DEPL.DX, OLD.DX) - 1.5 * OLD.DZ**2",
+        components=["DIFF"],
+        fields={"DEPL": depl2, "OLD": depl1},
+    )
+    assert list(combined.components) == ["DIFF"]
+    assert np.allclose(
+        combined.to_numpy(), np.maximum(values2[:, 0], values1[:, 0]) - 1.5 * values1[:, 2] ** 2
+    )
+
+
+def test_compile_expression():
+    compiled = medpro.compile_expression("sqrt(DEPL.DX**2+DEPL.DY**2) + pi")
+    assert compiled is medpro.compile_expression("sqrt(DEPL.DX**2+DEPL.DY**2) + pi")
+    assert compiled.variables == (("DEPL", "DX"), ("DEPL", "DY"))
+
+    with pytest.raises(ValueError):
+        medpro.compile_expression("__import__('os')")
+    with pytest.raises(ValueError):
+        medpro.compile_expression("DX +")
+
+
+def test_apply_expression_errors(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed")
+    depl = fp.fieldevols_by_name["reslin__DEPL"].get_field_at_timestep(1, 1)
+    with pytest.raises(ValueError):
+        depl.apply_expression("DRX*2")
+    with pytest.raises(ValueError):
+        depl.apply_expression("OTHER.DX*2")
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 import medpro
 
@@ -120,3 +121,64 @@ def test_extract_group(ex_dir):
     assert "DRY" in depl.components
     assert "DRZ" in depl.components    
     assert depl.to_numpy().size == len(depl.profile.node_ids_array) * len(depl.components)
+
+
+def test_extract_group_levels(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_shell_beam.rmed")
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    depl_all = depl_evol.get_field_at_timestep(1, 1)
+    mesh = fp.meshes_by_name["mesh"]
+
+    # Faces (SUP, SHELL) and edges (BEAM) give the nodes of their own level
+    for group_name, num_nodes in (("SUP", 9), ("SHELL", 14), ("BEAM", 3)):
+        node_ids = mesh.get_group_node_ids(group_name)
+        assert len(node_ids) == num_nodes
+        depl_group = depl_evol.extract_group(group_name)
+        assert len(depl_group.timesteps) == 3
+        depl = depl_group.get_field_at_timestep(1, 1)
+        assert depl.on_nodes
+        assert list(depl.components) == list(depl_evol.components)
+        assert np.array_equal(depl.profile.node_ids, node_ids)
+        rows = np.searchsorted(depl_all.profile.node_ids, node_ids)
+        assert np.array_equal(depl.to_numpy(), depl_all.to_numpy()[rows])
+
+        depl = depl_all.extract_group(group_name)
+        assert np.array_equal(depl.profile.node_ids, node_ids)
+
+
+def test_extract_node_group(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed")
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    depl_all = depl_evol.get_field_at_timestep(1, 1)
+
+    # DO is the single node 1
+    depl = depl_evol.extract_group("DO").get_field_at_timestep(1, 1)
+    assert np.array_equal(depl.profile.node_ids, [1])
+    assert np.array_equal(depl.to_numpy(), depl_all.to_numpy()[[1]])
+
+    sief_evol = fp.fieldevols_by_name["reslin__SIEF_ELGA"]
+    with pytest.raises(NotImplementedError):
+        sief_evol.get_field_at_timestep(1, 1).extract_group("DO")
+    with pytest.raises(NotImplementedError):
+        sief_evol.extract_group("G1")
+    with pytest.raises(NotImplementedError):
+        sief_evol.extract_groups(["G1"])
+
+
+def test_extract_groups_levels(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_shell_beam.rmed")
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    mesh = fp.meshes_by_name["mesh"]
+
+    depl_by_group = depl_evol.extract_groups(["SUP", "G1", "BEAM", "DO"])
+    assert list(depl_by_group) == ["SUP", "G1", "BEAM", "DO"]
+    for group_name, depl_group in depl_by_group.items():
+        assert len(depl_group.timesteps) == 3
+        assert np.array_equal(
+            depl_group.get_field_at_timestep(1, 1).profile.node_ids,
+            mesh.get_group_node_ids(group_name),
+        )
+        assert np.array_equal(
+            depl_group.to_numpy_stack(), depl_evol.extract_group(group_name).to_numpy_stack()
+        )
+    assert depl_evol.extract_groups([]) == {}
@@ -0,0 +1,70 @@
+import os
+import tempfile
+
+import medpro
+import numpy as np
+import pytest
+
+
+def test_add_fields(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed")
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+
+    new_fields = []
+    for pos, depl in enumerate(depl_evol.field_by_timestep.values()):
+        new_depl = depl * 2
+        new_depl.set_timestamp(10 + pos, 10 + pos, 1000.0 + pos)
+        new_fields.append(new_depl)
+    depl_evol.add_fields(new_fields)
+    assert len(depl_evol.timesteps) == 6
+    assert np.array_equal(
+        depl_evol.get_field_at_timestep(11, 11).to_numpy(),
+        2 * depl_evol.get_field_at_timestep(2, 2).to_numpy(),
+    )
+
+    with pytest.raises(ValueError):
+        depl_evol.add_fields(new_fields[:1])
+    with pytest.raises(ValueError):
+        depl_evol.add_fields([depl, depl])
+
+
+def test_from_numpy(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_depl.rmed")
+    mesh = fp.meshes_by_name["mesh"]
+
+    times = np.linspace(0.0, 1.0, 5)
+    values = np.random.default_rng(0).random((5, mesh.num_nodes, 3))
+    fieldevol = medpro.MEDFieldEvol.from_numpy(mesh, "DEPL", times, values, ["DX", "DY", "DZ"])
+    assert len(fieldevol.timesteps) == 5
+    assert fieldevol.timesteps[2].time == times[2]
+    depl = fieldevol.get_field_at_timestep(3, 3)
+    assert list(depl.components) == ["DX", "DY", "DZ"]
+    assert np.array_equal(depl.to_numpy(), values[2])
+
+    fpnew = medpro.MEDFilePost()
+    fpnew.add_mesh(mesh)
+    fpnew.add_fieldevol(fieldevol)
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath = os.path.join(tempdir, "new.rmed")
+        fpnew.write(tmpfilepath)
+
+    with pytest.raises(ValueError):
+        medpro.MEDFieldEvol.from_numpy(mesh, "DEPL", times, values, ["DX", "DY"])
+
+
+def test_to_numpy_stack(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed", lazy=True)
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    header_size = depl_evol.file_field_multits.getHeapMemorySize()
+
+    stack = depl_evol.to_numpy_stack()
+    assert stack.shape == (3, 35, 3)
+    assert stack.flags.c_contiguous
+    assert depl_evol.file_field_multits.getHeapMemorySize() == header_size
+    for step, depl in enumerate(depl_evol.field_by_timestep.values()):
+        assert np.array_equal(stack[step], depl.to_numpy())
+
+    timesteps = depl_evol.timesteps[1:]
+    stack_dz = depl_evol.to_numpy_stack(timesteps=timesteps, components=["DZ"])
+    assert stack_dz.shape == (2, 35, 1)
+    assert np.array_equal(stack_dz[:, :, 0], stack[1:, :, 2])
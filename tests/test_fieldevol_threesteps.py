@@ -1,5 +1,6 @@
 import medpro
 import numpy as np
+import pytest
 
 
 def test_field_evol(ex_dir):
@@ -110,3 +111,59 @@ def test_extract_group(ex_dir):
     assert "DY" in depl.components
     assert "DZ" in depl.components
     assert depl.to_numpy().size == len(depl.profile.node_ids_array) * len(depl.components)
+
+
+def test_timestep_index(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed")
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+
+    assert depl_evol.has_timestep(2, 2)
+    assert not depl_evol.has_timestep(4, 4)
+    assert depl_evol.get_nearest_timestep(0.0) == depl_evol.timesteps[0]
+
+    depl = depl_evol.get_field_at_timestep(3, 3)
+    depl.set_timestamp(4, 4, 1500.0)
+    depl_evol.add_field(depl)
+    assert depl_evol.has_timestep(4, 4)
+    assert depl_evol.get_nearest_timestep(1400.0) == medpro.TimeStamp(4, 4, 1500.0)
+    assert depl_evol.get_field_at_timestep(4, 4).timestamp.time == 1500.0
+
+    with pytest.raises(ValueError):
+        depl_evol.add_field(depl)
+    with pytest.raises(ValueError):
+        depl_evol.get_field_at_timestep(5, 5)
+
+
+def test_extract_group_values(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed")
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    g1_node_ids = fp.meshes_by_name["mesh"].get_group_by_name("G1").node_ids
+
+    depl_g1 = depl_evol.extract_group("G1")
+    assert np.array_equal(depl_g1.profile.node_ids, g1_node_ids)
+    assert np.array_equal(depl_g1.to_numpy_stack(), depl_evol.to_numpy_stack()[:, g1_node_ids, :])
+    assert np.array_equal(
+        depl_g1.to_numpy_stack(), fp.load_field_on_group("reslin__DEPL", "G1").to_numpy_stack()
+    )
+
+    depl = depl_evol.get_field_at_timestep(2, 2)
+    assert np.array_equal(
+        depl.extract_group("G1").to_numpy(), depl_g1.get_field_at_timestep(2, 2).to_numpy()
+    )
+
+
+def test_extract_groups(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed")
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+
+    depl_by_group = depl_evol.extract_groups(["G1", "ALLVOL"])
+    assert list(depl_by_group) == ["G1", "ALLVOL"]
+    for group_name, depl_group in depl_by_group.items():
+        assert len(depl_group.timesteps) == 3
+        assert np.array_equal(
+            depl_group.to_numpy_stack(), depl_evol.extract_group(group_name).to_numpy_stack()
+        )
+    mesh = fp.meshes_by_name["mesh"]
+    assert depl_by_group["G1"].profile is mesh.get_group_selection(
+        "G1", depl_evol.get_field_at_timestep(1, 1).profile
+    ).profile
@@ -1,5 +1,7 @@
 import medpro
+import pytest
 import numpy as np
+import medcoupling as mc
 
 
 def test_field_evol_profile(ex_dir):
@@ -97,3 +99,82 @@ def test_extract_group_profile(ex_dir):
     assert "DY" in depl.components
     assert "DZ" in depl.components
     assert depl.to_numpy().size == 8 * len(depl.components)
+
+
+def test_extract_group_profile_values(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_profile.rmed")
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    depl = depl_evol.get_field_at_timestep(1, 1)
+    depl_g1 = depl_evol.extract_group("G1").get_field_at_timestep(1, 1)
+
+    node_ids = depl_g1.profile.node_ids
+    assert np.all(np.isin(node_ids, fp.meshes_by_name["mesh"].get_group_by_name("G1").node_ids))
+    rows = np.searchsorted(depl.profile.node_ids, node_ids)
+    assert np.array_equal(depl_g1.to_numpy(), depl.to_numpy()[rows])
+
+
+def test_profile_interning(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_profile.rmed")
+    mesh = fp.meshes_by_name["mesh"]
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    depl = depl_evol.get_field_at_timestep(1, 1)
+    depl_again = depl_evol.get_field_at_timestep(1, 1)
+    assert depl.profile is depl_again.profile
+
+    # Equal ids, even in a distinct array with another name, give the shared profile
+    copy_array = depl.profile.node_ids_array.deepCopy()
+    copy_array.setName("COPY")
+    assert mesh.intern_profile(copy_array) is depl.profile
+    assert medpro.MEDProfile(mesh, copy_array) == depl.profile
+    assert medpro.MEDProfile(mesh, copy_array[:3]) != depl.profile
+
+    assert np.array_equal((depl - depl_again).to_numpy(), np.zeros_like(depl.to_numpy()))
+    assert (depl - depl_again).name == "reslin__DEPL_minus_reslin__DEPL"
+    assert np.array_equal((depl * depl_again).to_numpy(), depl.to_numpy() ** 2)
+    assert np.array_equal((1.0 - depl).to_numpy(), 1.0 - depl.to_numpy())
+
+    other = medpro.MEDFilePost(ex_dir / "box_profile.rmed").fieldevols_by_name["reslin__DEPL"]
+    with pytest.raises(ValueError):
+        depl + other.get_field_at_timestep(1, 1)
+
+
+def test_align(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_profile.rmed")
+    mesh = fp.meshes_by_name["mesh"]
+    depl = fp.fieldevols_by_name["reslin__DEPL"].get_field_at_timestep(1, 1)
+    depl_g1 = depl.extract_group("G1")
+    first_ids = mc.DataArrayInt(np.array(depl.profile.node_ids[:8]))
+    first_ids.setName("FIRST")
+    depl_first = medpro.MEDFieldEvol.from_numpy(
+        mesh,
+        "FIRST",
+        [0.0],
+        np.asarray(depl)[None, :8],
+        list(depl.components),
+        mesh.intern_profile(first_ids),
+    ).get_field_at_timestep(1, 1)
+    g1_ids, first_ids = depl_g1.profile.node_ids, depl_first.profile.node_ids
+    assert 0 < len(np.intersect1d(g1_ids, first_ids)) < len(g1_ids)
+
+    with pytest.raises(ValueError):
+        depl_g1 + depl_first
+
+    union = depl_g1.add(depl_first, align="union")
+    node_ids = np.union1d(g1_ids, first_ids)
+    assert list(union.profile.node_ids) == list(node_ids)
+    assert union.field_double.getMesh().getNumberOfNodes() == len(node_ids)
+    union.field_double.checkConsistencyLight()
+    values = np.asarray(depl)
+    rows = [list(depl.profile.node_ids).index(node) for node in node_ids]
+    in_both = np.isin(node_ids, g1_ids).astype(float) + np.isin(node_ids, first_ids)
+    assert np.allclose(np.asarray(union), values[rows] * in_both[:, None])
+
+    intersection = depl_g1.subtract(depl_first, align="intersection")
+    assert list(intersection.profile.node_ids) == list(np.intersect1d(g1_ids, first_ids))
+    assert np.allclose(np.asarray(intersection), 0.0)
+
+    # The combined profile is interned, aligning again reuses it and its computed mesh
+    aligned_g1, aligned_first = depl_g1.align(depl_first, "union", fill_value=np.nan)
+    assert aligned_g1.profile is union.profile is aligned_first.profile
+    assert np.isnan(np.asarray(aligned_g1)[~np.isin(node_ids, g1_ids)]).all()
+    assert mesh.get_computed_mesh(union.profile) is mesh.get_computed_mesh(aligned_g1.profile)
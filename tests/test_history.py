@@ -0,0 +1,52 @@
+import medpro
+import numpy as np
+import pytest
+
+
+def test_history_nodes(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed", lazy=True)
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    stack = depl_evol.to_numpy_stack()
+
+    history = depl_evol.history(node_ids=[3, 1])
+    assert history.shape == (3, 2, 3)
+    assert np.array_equal(history, stack[:, [3, 1], :])
+
+    history_dz = depl_evol.history(node_ids=[3], components=["DZ"], timesteps=depl_evol.timesteps[2:])
+    assert np.array_equal(history_dz[:, 0, 0], stack[2:, 3, 2])
+
+    g1_node_ids = fp.meshes_by_name["mesh"].get_group_by_name("G1").node_ids
+    assert np.array_equal(depl_evol.history(group="G1"), stack[:, g1_node_ids, :])
+
+    with pytest.raises(ValueError):
+        depl_evol.history(node_ids=[1], group="G1")
+
+
+def test_history_profile(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_profile.rmed")
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    depl = depl_evol.get_field_at_timestep(1, 1)
+    node_ids = depl.profile.node_ids
+
+    history = depl_evol.history(node_ids=node_ids[[4, 0]])
+    assert np.array_equal(history[0], depl.to_numpy()[[4, 0]])
+    g1_node_ids = fp.meshes_by_name["mesh"].get_group_by_name("G1").node_ids
+    assert depl_evol.history(group="G1").shape == (1, len(np.intersect1d(g1_node_ids, node_ids)), 3)
+    with pytest.raises(ValueError):
+        depl_evol.history(node_ids=[2])
+
+
+def test_history_group_levels(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed")
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    stack = depl_evol.to_numpy_stack()
+
+    # Node group of a single monitoring node
+    history = depl_evol.history(group="DO")
+    assert history.shape == (3, 1, 3)
+    assert np.array_equal(history, stack[:, [1], :])
+
+    # Face group
+    sup_node_ids = fp.meshes_by_name["mesh"].get_group_node_ids("SUP")
+    assert len(sup_node_ids) == 9
+    assert np.array_equal(depl_evol.history(group="SUP"), stack[:, sup_node_ids, :])
@@ -0,0 +1,40 @@
+import medpro
+import numpy as np
+import pytest
+
+
+def build_evol(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_depl.rmed")
+    mesh = fp.meshes_by_name["mesh"]
+    times = [0.0, 1.0, 3.0]
+    values = np.stack([np.full((mesh.num_nodes, 3), t) for t in (0.0, 10.0, 30.0)])
+    return medpro.MEDFieldEvol.from_numpy(mesh, "DEPL", times, values, ["DX", "DY", "DZ"])
+
+
+def test_get_field_at_time(ex_dir):
+    fieldevol = build_evol(ex_dir)
+
+    depl = fieldevol.get_field_at_time(2.5)
+    assert depl.timestamp == medpro.TimeStamp(-1, -1, 2.5)
+    assert np.allclose(depl.to_numpy(), 25.0)
+    assert np.allclose(fieldevol.get_field_at_time(3.0).to_numpy(), 30.0)
+    assert np.allclose(fieldevol.get_field_at_time(2.5, method="previous").to_numpy(), 10.0)
+    assert np.allclose(fieldevol.get_field_at_time(2.5, method="nearest").to_numpy(), 30.0)
+    assert np.allclose(fieldevol.get_field_at_time(7.0, method="nearest").to_numpy(), 30.0)
+
+    with pytest.raises(ValueError):
+        fieldevol.get_field_at_time(4.0)
+    with pytest.raises(ValueError):
+        fieldevol.get_field_at_time(-1.0, method="previous")
+    with pytest.raises(ValueError):
+        fieldevol.get_field_at_time(1.0, method="cubic")
+
+
+def test_resample(ex_dir):
+    fieldevol = build_evol(ex_dir)
+
+    resampled = fieldevol.get_field_at_time(np.linspace(0.0, 3.0, 7))
+    assert len(resampled.timesteps) == 7
+    assert resampled.timesteps[1] == medpro.TimeStamp(2, 2, 0.5)
+    stack = resampled.to_numpy_stack()
+    assert np.allclose(stack[:, 0, 0], [0.0, 5.0, 10.0, 15.0, 20.0, 25.0, 30.0])
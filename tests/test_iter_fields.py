@@ -0,0 +1,33 @@
+import medpro
+import numpy as np
+
+
+def test_iter_fields(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed", lazy=True)
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    header_size = depl_evol.file_field_multits.getHeapMemorySize()
+
+    fields = []
+    for depl in depl_evol.iter_fields():
+        assert depl.name == "reslin__DEPL"
+        fields.append(depl.to_numpy().copy())
+    assert len(fields) == 3
+    assert depl_evol.file_field_multits.getHeapMemorySize() == header_size
+
+    fp_ref = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed")
+    depl_evol_ref = fp_ref.fieldevols_by_name["reslin__DEPL"]
+    for values, depl_ref in zip(fields, depl_evol_ref.field_by_timestep.values()):
+        assert np.array_equal(values, depl_ref.to_numpy())
+
+
+def test_iter_fields_prefetch(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed", lazy=True)
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    header_size = depl_evol.file_field_multits.getHeapMemorySize()
+
+    timestamps = [depl.timestamp for depl in depl_evol.iter_fields(prefetch=2)]
+    assert timestamps == depl_evol.timesteps
+
+    for depl in depl_evol.iter_fields(prefetch=1):
+        break
+    assert depl_evol.file_field_multits.getHeapMemorySize() == header_size
@@ -0,0 +1,40 @@
+import os
+import tempfile
+
+import medpro
+import numpy as np
+
+
+def test_lazy_headers(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed", lazy=True)
+
+    assert "mesh" in fp.meshes_by_name
+    assert not fp.meshes_by_name["mesh"].is_loaded
+    assert len(fp.fieldevols_by_name) == 2
+
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    assert list(depl_evol.components) == ["DX", "DY", "DZ"]
+    assert len(depl_evol.timesteps) == 3
+    assert depl_evol.file_field_multits.getHeapMemorySize() < 2048
+    assert not fp.meshes_by_name["mesh"].is_loaded
+
+
+def test_lazy_field(ex_dir):
+    fp_lazy = medpro.MEDFilePost(ex_dir / "box_profile.rmed", lazy=True)
+    fp = medpro.MEDFilePost(ex_dir / "box_profile.rmed")
+
+    depl = fp_lazy.fieldevols_by_name["reslin__DEPL"].get_field_at_timestep(1, 1)
+    depl_ref = fp.fieldevols_by_name["reslin__DEPL"].get_field_at_timestep(1, 1)
+    assert fp_lazy.meshes_by_name["mesh"].is_loaded
+    assert np.array_equal(depl.to_numpy(), depl_ref.to_numpy())
+    assert np.array_equal(depl.profile.node_ids, depl_ref.profile.node_ids)
+
+
+def test_lazy_write(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed", lazy=True)
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath = os.path.join(tempdir, "output.rmed")
+        fp.write(tmpfilepath)
+        fpnew = medpro.MEDFilePost(tmpfilepath)
+        assert "mesh" in fpnew.meshes_by_name
+        assert len(fpnew.fieldevols_by_name["reslin__DEPL"].field_by_timestep) == 3
@@ -29,3 +29,38 @@ def test_mesh(ex_dir):
     assert mesh.name == "mesh2"
     # assert "mesh2" in fp.meshes_by_name
     # assert "mesh" not in fp.meshes_by_name
+
+
+def test_registries_identity(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed")
+    mesh = fp.meshes_by_name["mesh"]
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    assert fp.meshes_by_name["mesh"] is mesh
+    assert fp.fieldevols_by_name["reslin__DEPL"] is depl_evol
+    assert depl_evol.mesh is mesh
+
+    depl_g1 = depl_evol.extract_group("G1")
+    depl_g1.name = "reslin__DEPL_G1"
+    fp.add_fieldevol(depl_g1)
+    assert fp.fieldevols_by_name[depl_g1.name] is depl_g1
+    assert len(fp.fieldevols_by_name) == 3
+
+    fp.invalidate()
+    assert fp.fieldevols_by_name["reslin__DEPL"] is not depl_evol
+    assert len(fp.fieldevols_by_name) == 3
+
+
+def test_computed_mesh_shared(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_shell_beam.rmed")
+    mesh = fp.meshes_by_name["mesh"]
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    depl_evol_copy = medpro.MEDFieldEvol(mesh, depl_evol.file_field_multits.deepCopy())
+    assert depl_evol_copy.computed_mesh is depl_evol.computed_mesh
+
+    profile = depl_evol.get_field_at_timestep(1, 1).profile
+    same_profile = medpro.MEDProfile(mesh, profile.node_ids_array.deepCopy())
+    assert profile.fingerprint == same_profile.fingerprint
+    assert mesh.get_computed_mesh(same_profile) is depl_evol.computed_mesh
+
+    efge_evol = fp.fieldevols_by_name["reslin__EFGE_NOEU"]
+    assert efge_evol.computed_mesh is not depl_evol.computed_mesh
@@ -0,0 +1,24 @@
+import medpro
+import numpy as np
+
+
+def test_load_field_on_group(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed")
+
+    depl_g1 = fp.load_field_on_group("reslin__DEPL", "G1")
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    node_ids = fp.meshes_by_name["mesh"].get_group_by_name("G1").node_ids
+    assert len(depl_g1.timesteps) == 3
+    assert np.array_equal(depl_g1.profile.node_ids, node_ids)
+    for timestamp, depl in depl_g1.field_by_timestep.items():
+        depl_ref = depl_evol.get_field_at_timestep(timestamp.iteration, timestamp.order)
+        assert depl.name == "reslin__DEPL"
+        assert list(depl.components) == ["DX", "DY", "DZ"]
+        assert np.array_equal(depl.to_numpy(), depl_ref.to_numpy()[node_ids])
+
+def test_load_field_on_group_profile(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_profile.rmed", lazy=True)
+
+    depl_g1 = fp.load_field_on_group("reslin__DEPL", "G1")
+    depl = depl_g1.get_field_at_timestep(1, 1)
+    assert depl.to_numpy().size == 8 * len(depl.components)
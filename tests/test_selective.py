@@ -0,0 +1,59 @@
+import medpro
+import numpy as np
+import pytest
+
+
+def test_select_fields(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed", fields=["reslin__DEPL"])
+
+    assert list(fp.fieldevols_by_name) == ["reslin__DEPL"]
+    assert "mesh" in fp.meshes_by_name
+    assert len(fp.fieldevols_by_name["reslin__DEPL"].timesteps) == 3
+
+
+def test_select_timesteps(ex_dir):
+    fp_all = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed")
+    fp = medpro.MEDFilePost(
+        ex_dir / "box_with_deplevol.rmed", fields=["reslin__DEPL"], timesteps=slice(-1, None)
+    )
+
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    assert [(ts.iteration, ts.order) for ts in depl_evol.timesteps] == [(3, 3)]
+    depl = depl_evol.get_field_at_timestep(3, 3)
+    depl_ref = fp_all.fieldevols_by_name["reslin__DEPL"].get_field_at_timestep(3, 3)
+    assert np.array_equal(depl.to_numpy(), depl_ref.to_numpy())
+
+    fp = medpro.MEDFilePost(
+        ex_dir / "box_with_deplevol.rmed", timesteps=lambda ts: ts.iteration <= 2, lazy=True
+    )
+    assert len(fp.fieldevols_by_name) == 2
+    for fieldevol in fp.fieldevols_by_name.values():
+        assert len(fieldevol.timesteps) == 2
+
+
+def test_select_missing(ex_dir):
+    with pytest.raises(ValueError):
+        medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed", fields=["reslin__SIGM"])
+    with pytest.raises(ValueError):
+        medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed", meshes=["mesh2"])
+
+
+@pytest.mark.parametrize("file_name", ["box_with_deplevol.rmed", "box_profile.rmed"])
+def test_select_lazy_values(ex_dir, file_name):
+    fp_all = medpro.MEDFilePost(ex_dir / file_name)
+    depl_ref = fp_all.fieldevols_by_name["reslin__DEPL"]
+
+    fp = medpro.MEDFilePost(
+        ex_dir / file_name,
+        lazy=True,
+        fields=["reslin__DEPL"],
+        meshes=["mesh"],
+        timesteps=slice(0, 2),
+    )
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    assert depl_evol.timesteps == depl_ref.timesteps[:2]
+    for timestep in depl_evol.timesteps:
+        depl = depl_evol.get_field_at_timestep(timestep.iteration, timestep.order)
+        expected = depl_ref.get_field_at_timestep(timestep.iteration, timestep.order)
+        assert np.array_equal(depl.to_numpy(), expected.to_numpy())
+    assert [depl.timestamp for depl in depl_evol.iter_fields()] == depl_evol.timesteps
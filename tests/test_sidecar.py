@@ -0,0 +1,67 @@
+import os
+import shutil
+import tempfile
+
+import medpro
+import numpy as np
+import pytest
+
+
+def test_history_sidecar(ex_dir):
+    with tempfile.TemporaryDirectory() as tempdir:
+        file_name = os.path.join(tempdir, "box_with_deplevol.rmed")
+        shutil.copy(ex_dir / "box_with_deplevol.rmed", file_name)
+        fp = medpro.MEDFilePost(file_name, lazy=True)
+        depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+
+        sidecar = fp.history_sidecar("reslin__DEPL")
+        assert os.path.exists(f"{file_name}.reslin__DEPL.history.npy")
+        assert sidecar.timesteps == depl_evol.timesteps
+        assert np.array_equal(sidecar.history([3, 1]), depl_evol.history(node_ids=[3, 1]))
+
+        reopened = medpro.HistorySidecar.open(sidecar.path, file_name, depl_evol)
+        assert reopened is not None
+        assert isinstance(reopened.values, np.memmap)
+        assert isinstance(reopened.node_ids, np.memmap)
+        assert os.path.exists(f"{file_name}.reslin__DEPL.history.nodes.npy")
+        assert np.array_equal(reopened.history([7]), sidecar.history([7]))
+        with pytest.raises(ValueError):
+            reopened.history([-1])
+
+        # The sidecar is not reused for other timesteps of the field
+        fp_last = medpro.MEDFilePost(file_name, timesteps=slice(-1, None))
+        depl_last = fp_last.fieldevols_by_name["reslin__DEPL"]
+        assert medpro.HistorySidecar.open(sidecar.path, file_name, depl_last) is None
+        sidecar_last = fp_last.history_sidecar("reslin__DEPL")
+        assert sidecar_last.timesteps == depl_last.timesteps
+        assert fp.history_sidecar("reslin__DEPL").timesteps == depl_evol.timesteps
+
+        stat = os.stat(file_name)
+        os.utime(file_name, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert medpro.HistorySidecar.open(sidecar.path, file_name, depl_evol) is None
+
+
+def test_history_sidecar_chunks(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed")
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "depl.npy")
+        sidecar = medpro.HistorySidecar.build(
+            depl_evol, path, ex_dir / "box_with_deplevol.rmed", chunk_steps=2
+        )
+        assert np.array_equal(sidecar.values.transpose(1, 0, 2), depl_evol.to_numpy_stack())
+        del sidecar
+
+
+def test_history_sidecar_other_field(ex_dir):
+    with tempfile.TemporaryDirectory() as tempdir:
+        file_name = os.path.join(tempdir, "box_shell_beam.rmed")
+        shutil.copy(ex_dir / "box_shell_beam.rmed", file_name)
+        fp = medpro.MEDFilePost(file_name)
+        path = os.path.join(tempdir, "history.npy")
+
+        depl = fp.history_sidecar("reslin__DEPL", path=path)
+        efge = fp.history_sidecar("reslin__EFGE_NOEU", path=path)
+        assert list(efge.components) == list(fp.fieldevols_by_name["reslin__EFGE_NOEU"].components)
+        assert efge.values.shape[2] == len(efge.components) != len(depl.components)
+        del depl, efge
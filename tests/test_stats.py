@@ -0,0 +1,95 @@
+import medpro
+import numpy as np
+import pytest
+
+
+def test_field_stats(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_profile.rmed")
+    depl = fp.fieldevols_by_name["reslin__DEPL"].get_field_at_timestep(1, 1)
+    values = np.asarray(depl)
+    coordinates = fp.meshes_by_name["mesh"].mesh_file.getCoords().toNumPyArray()
+
+    stats = depl.stats(chunk_size=5)
+    assert list(stats) == ["DX", "DY", "DZ"]
+    dz = stats["DZ"]
+    row = values[:, 2].argmax()
+    assert dz.maximum.value == values[row, 2]
+    assert dz.maximum.entity_id == depl.profile.node_ids[row]
+    assert dz.maximum.number == dz.maximum.entity_id + 1
+    assert dz.maximum.coordinates == tuple(coordinates[dz.maximum.entity_id])
+    assert dz.maximum.timestamp == depl.timestamp
+    assert dz.minimum.value == values[:, 2].min()
+    assert dz.mean == pytest.approx(values[:, 2].mean())
+    assert dz.l2_norm == pytest.approx(np.linalg.norm(values[:, 2]))
+
+    assert list(depl.stats(["DY"])) == ["DY"]
+    with pytest.raises(ValueError):
+        depl.stats(["DRX"])
+
+
+def test_gauss_field_stats(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_profile.rmed")
+    sief = fp.fieldevols_by_name["reslin__SIEF_ELGA"].get_field_at_timestep(1, 1)
+    values = np.asarray(sief)
+    maximum = sief.stats(["SIXX"])["SIXX"].maximum
+    row = values[:, 0].argmax()
+    # 8 Gauss points per cell, cell numbers are read from the file
+    assert maximum.entity_id == sief.profile.node_ids[row // 8]
+    number_field = fp.meshes_by_name["mesh"].mesh_file.getNumberFieldAtLevel(0)
+    assert maximum.number == number_field.toNumPyArray()[maximum.entity_id]
+    gauss_coordinates = sief.field_double.getLocalizationOfDiscr().toNumPyArray()
+    assert maximum.coordinates == tuple(gauss_coordinates[row])
+
+
+def test_fieldevol_stats(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed", lazy=True)
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    stack = depl_evol.to_numpy_stack()
+
+    stats = depl_evol.stats(["DX", "DZ"])
+    dz = stats["DZ"]
+    step, row = np.unravel_index(stack[:, :, 2].argmin(), stack.shape[:2])
+    assert dz.minimum.value == stack[step, row, 2]
+    assert dz.minimum.timestamp == depl_evol.timesteps[step]
+    assert dz.maximum.value == stack[:, :, 2].max()
+    assert dz.mean == pytest.approx(stack[:, :, 2].mean())
+    assert stats["DX"].l2_norm == pytest.approx(np.linalg.norm(stack[:, :, 0]))
+
+
+def test_stats_by_group(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_profile.rmed")
+    mesh = fp.meshes_by_name["mesh"]
+    depl = fp.fieldevols_by_name["reslin__DEPL"].get_field_at_timestep(1, 1)
+    values = np.asarray(depl)
+    node_ids = list(depl.profile.node_ids)
+
+    stats = depl.stats_by_group()
+    assert set(stats) == set(mesh.mesh_file.getGroupsNames())
+    for group_name in ("G1", "SUP", "DO"):
+        levels = mesh.mesh_file.getGrpNonEmptyLevelsExt(group_name)
+        group_ids = mesh.mesh_file.getGroupArr(levels[0], group_name, False)
+        if levels[0] == 1:
+            group_nodes = group_ids.toNumPyArray()
+        else:
+            group_cells = mesh.mesh_file.getMeshAtLevel(levels[0])[group_ids]
+            group_nodes = group_cells.computeFetchedNodeIds().toNumPyArray()
+        rows = [node_ids.index(node) for node in group_nodes if node in node_ids]
+        assert stats[group_name].count == len(rows)
+        assert stats[group_name].sum["DZ"] == pytest.approx(values[rows, 2].sum())
+        assert stats[group_name].mean["DX"] == pytest.approx(values[rows, 0].mean())
+        assert stats[group_name].minimum["DY"] == values[rows, 1].min()
+        assert stats[group_name].maximum["DZ"] == values[rows, 2].max()
+    assert stats["DY"].count == 0
+    assert np.isnan(stats["DY"].maximum["DX"])
+
+    sief = fp.fieldevols_by_name["reslin__SIEF_ELGA"].get_field_at_timestep(1, 1)
+    g1 = sief.stats_by_group(["SIXX"])["G1"]
+    g1_cells = mesh.mesh_file.getGroupArr(0, "G1", False).toNumPyArray()
+    rows = [
+        8 * row + gauss
+        for row, cell in enumerate(sief.profile.node_ids)
+        if cell in g1_cells
+        for gauss in range(8)
+    ]
+    assert g1.count == len(rows)
+    assert g1.maximum["SIXX"] == np.asarray(sief)[rows, 0].max()
@@ -0,0 +1,67 @@
+import medpro
+import numpy as np
+import pytest
+
+
+def test_tensor_invariants(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed")
+    sief = fp.fieldevols_by_name["reslin__SIEF_ELGA"].get_field_at_timestep(2, 2)
+    assert sief.on_gauss_points
+    tensors = np.asarray(sief)
+    matrices = tensors[:, [0, 3, 4, 3, 1, 5, 4, 5, 2]].reshape(-1, 3, 3)
+    eigenvalues = np.linalg.eigvalsh(matrices)
+    deviatoric = matrices - np.trace(matrices, axis1=1, axis2=2)[:, None, None] / 3.0 * np.eye(3)
+    von_mises = np.sqrt(1.5 * np.sum(deviatoric**2, axis=(1, 2)))
+
+    sieq = sief.tensor_invariants(
+        ["von_mises", "tresca", "principal", "directions", "pressure", "triaxiality"]
+    )
+    assert sieq.name == "reslin__SIEF_ELGA_EQ"
+    assert sieq.on_gauss_points
+    assert sieq.timestamp == sief.timestamp
+    assert list(sieq.components) == (
+        ["VMIS", "TRESCA", "PRIN_1", "PRIN_2", "PRIN_3"]
+        + [f"VECT_{i}_{axis}" for i in (1, 2, 3) for axis in "XYZ"]
+        + ["PRES", "TRIAX"]
+    )
+    values = np.asarray(sieq)
+    scale = np.abs(tensors).max()
+    assert np.allclose(values[:, 0], von_mises, atol=1e-9 * scale)
+    assert np.allclose(values[:, 1], eigenvalues[:, 2] - eigenvalues[:, 0], atol=1e-9 * scale)
+    assert np.allclose(values[:, 2:5], eigenvalues, atol=1e-9 * scale)
+    directions = values[:, 5:14].reshape(-1, 3, 3)
+    assert np.allclose(
+        np.einsum("nij,nkj->nki", matrices, directions),
+        values[:, 2:5, None] * directions,
+        atol=1e-9 * scale,
+    )
+    assert np.allclose(values[:, 14], -np.trace(matrices, axis1=1, axis2=2) / 3.0)
+    assert np.allclose(values[:, 15], -values[:, 14] / von_mises)
+
+    # Closed form principal values without directions
+    principal = sief.tensor_invariants(["principal"])
+    assert np.allclose(np.asarray(principal), eigenvalues, atol=1e-9 * scale)
+
+    with pytest.raises(ValueError):
+        sief.tensor_invariants(["hydrostatic"])
+
+
+def test_tensor_invariants_closed_form():
+    tensors = np.array([[1.0, 2.0, 3.0, 0.0, 0.0, 0.0], [5.0, 5.0, 5.0, 0.0, 0.0, 0.0]])
+    values, components = medpro.compute_tensor_invariants(tensors, ["principal", "von_mises"])
+    assert components == ["PRIN_1", "PRIN_2", "PRIN_3", "VMIS"]
+    assert np.allclose(values, [[1.0, 2.0, 3.0, np.sqrt(3.0)], [5.0, 5.0, 5.0, 0.0]])
+
+
+def test_fieldevol_tensor_invariants(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed")
+    sief_evol = fp.fieldevols_by_name["reslin__SIEF_ELGA"]
+    vmis_evol = sief_evol.tensor_invariants(["von_mises"], name="VMIS")
+    assert vmis_evol.name == "VMIS"
+    assert vmis_evol.timesteps == sief_evol.timesteps
+    for timestep in sief_evol.timesteps:
+        expected = sief_evol.get_field_at_timestep(timestep.iteration, timestep.order)
+        vmis = vmis_evol.get_field_at_timestep(timestep.iteration, timestep.order)
+        assert np.allclose(
+            np.asarray(vmis), np.asarray(expected.tensor_invariants(["von_mises"]))
+        )
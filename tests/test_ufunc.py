@@ -0,0 +1,43 @@
+import medpro
+import numpy as np
+import pytest
+
+
+def test_ufunc(ex_dir):
+    fp = medpro.MEDFilePost(ex_dir / "box_with_deplevol.rmed")
+    depl_evol = fp.fieldevols_by_name["reslin__DEPL"]
+    depl1 = depl_evol.get_field_at_timestep(1, 1)
+    depl2 = depl_evol.get_field_at_timestep(2, 2)
+    values1, values2 = np.asarray(depl1), np.asarray(depl2)
+    assert values1.shape == (len(depl1.profile.node_ids), 3)
+
+    maximum = np.maximum(depl1, depl2)
+    assert isinstance(maximum, medpro.MEDField)
+    assert maximum.profile is depl1.profile
+    assert maximum.timestamp == depl1.timestamp
+    assert list(maximum.components) == list(depl1.components)
+    assert np.array_equal(np.asarray(maximum), np.maximum(values1, values2))
+
+    absolute = np.sqrt(np.abs(depl2))
+    assert np.array_equal(np.asarray(absolute), np.sqrt(np.abs(values2)))
+    assert np.array_equal(np.asarray(values1 * depl2), values1 * values2)
+
+    out = depl1.with_values(np.zeros_like(values1))
+    assert np.add(depl1, depl2, out=out) is out
+    assert np.array_equal(out.to_numpy(), values1 + values2)
+
+    norm = np.linalg.norm(depl2, axis=1)
+    assert isinstance(norm, medpro.MEDField)
+    assert np.allclose(norm.to_numpy(), np.linalg.norm(values2, axis=1))
+    assert np.sum(depl2) == pytest.approx(values2.sum())
+
+
+def test_ufunc_supports(ex_dir):
+    depl = medpro.MEDFilePost(ex_dir / "box_profile.rmed").fieldevols_by_name[
+        "reslin__DEPL"
+    ].get_field_at_timestep(1, 1)
+    other = medpro.MEDFilePost(ex_dir / "box_profile.rmed").fieldevols_by_name[
+        "reslin__DEPL"
+    ].get_field_at_timestep(1, 1)
+    with pytest.raises(ValueError):
+        np.maximum(depl, other)